@@ -2,6 +2,7 @@ import customtkinter
 from gui.encrypt_frame import EncryptFrame
 from gui.decrypt_frame import DecryptFrame
 from gui.toast import ToastNotification
+from operations.key_pool import start_default_pool, shutdown_default_pool
 
 
 class App(customtkinter.CTk):
@@ -14,6 +15,9 @@ class App(customtkinter.CTk):
         customtkinter.set_default_color_theme("blue")
 
         self.active_toast = None
+        # Pre-generate RSA key pairs in the background so "RSA Key Gen" returns at once.
+        start_default_pool()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -80,6 +84,10 @@ class App(customtkinter.CTk):
         }
         self.select_frame("encrypt")
 
+    def on_close(self):
+        shutdown_default_pool()
+        self.destroy()
+
     def show_toast(self, title, message, toast_type="info"):
         if self.active_toast is not None and self.active_toast.winfo_exists():
             self.active_toast.destroy()
@@ -0,0 +1,139 @@
+# File: batch.py
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine.optimizer import optimize_recipe
+from engine.recipe import load_recipe_file, invert_recipe, skipped_inverse_message
+from engine.recipe_engine import RecipeEngine
+from engine.streaming import DEFAULT_CHUNK_SIZE, buffered_operations, stream_file
+
+# One engine per worker process, built on first use.
+_worker_engines = {}
+
+
+def collect_input_files(patterns: list[str]) -> list[str]:
+    """Expands directories and glob patterns into a sorted list of files."""
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for name in os.listdir(pattern):
+                path = os.path.join(pattern, name)
+                if os.path.isfile(path):
+                    files.add(path)
+        else:
+            files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(files)
+
+
+def output_paths(input_files: list[str], output_dir: str, suffix: str = "") -> dict[str, str]:
+    """
+    Maps each input file to its output path, keeping its path relative to the
+    inputs' common directory so files with the same name never collide.
+    """
+    directories = [os.path.dirname(os.path.abspath(path)) for path in input_files]
+    root = os.path.commonpath(directories) if directories else ""
+    return {path: os.path.join(output_dir, os.path.relpath(os.path.abspath(path), root) + suffix)
+            for path in input_files}
+
+
+def process_file(mode, steps, input_path, output_path, chunk_size):
+    """Worker function: streams one file through the recipe (runs in a pool process)."""
+    engine = _worker_engines.get(mode)
+    if engine is None:
+        engine = _worker_engines[mode] = RecipeEngine(mode)
+    start = time.perf_counter()
+    success, message = stream_file(engine, steps, input_path, output_path, chunk_size)
+    return success, message, os.path.getsize(input_path), time.perf_counter() - start
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a saved CryptoSuite recipe to many files.")
+    parser.add_argument("recipe", help="Recipe JSON file saved from the GUI.")
+    parser.add_argument("inputs", nargs="+", help="Input files, directories or glob patterns.")
+    parser.add_argument("-o", "--output-dir", required=True,
+                        help="Directory to write results to; input subdirectories are kept.")
+    parser.add_argument("-s", "--suffix", default="", help="Suffix appended to each output file name.")
+    parser.add_argument("-d", "--decrypt", action="store_true",
+                        help="Invert the recipe and run it in decrypt mode, like 'Load & Invert'.")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="Number of worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Bytes read per chunk.")
+    parser.add_argument("--no-optimize", action="store_true", help="Run the recipe exactly as saved.")
+    parser.add_argument("--explain", action="store_true",
+                        help="Print the optimized plan and exit without processing any files.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    try:
+        steps = load_recipe_file(args.recipe)
+    except Exception as e:
+        print(f"Failed to load recipe: {e}", file=sys.stderr)
+        return 2
+    mode = "encrypt"
+    if args.decrypt:
+        mode = "decrypt"
+        steps, skipped = invert_recipe(steps)
+        for name in skipped:
+            print(f"Warning: {skipped_inverse_message(name)}", file=sys.stderr)
+    if not steps:
+        print("Recipe is empty, nothing to do.", file=sys.stderr)
+        return 2
+    if not args.no_optimize or args.explain:
+        optimized = optimize_recipe(RecipeEngine(mode), steps)
+        if args.explain:
+            print(optimized.explain())
+            return 0
+        steps = optimized.steps
+    for name in dict.fromkeys(buffered_operations(RecipeEngine(mode), steps)):
+        print(f"Warning: '{name}' cannot stream; each file will be read into memory whole.", file=sys.stderr)
+
+    input_files = collect_input_files(args.inputs)
+    if not input_files:
+        print("No input files matched.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_dir = os.path.abspath(args.output_dir)
+    jobs = {}
+    for input_path, output_path in output_paths(input_files, output_dir, args.suffix).items():
+        if os.path.abspath(input_path) == output_path:
+            print(f"Skipping {input_path}: output would overwrite the input.", file=sys.stderr)
+            continue
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        jobs[input_path] = output_path
+
+    total_bytes, failures = 0, 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(process_file, mode, steps, input_path, output_path, args.chunk_size): input_path
+                   for input_path, output_path in jobs.items()}
+        for done, future in enumerate(as_completed(futures), start=1):
+            input_path = futures[future]
+            try:
+                success, message, size, elapsed = future.result()
+            except Exception as e:
+                success, message, size, elapsed = False, str(e), 0, 0.0
+            status = "ok" if success else "FAILED"
+            print(f"[{done}/{len(futures)}] {status} {input_path} ({size} bytes, {elapsed:.2f}s): {message}")
+            if success:
+                total_bytes += size
+            else:
+                failures += 1
+    elapsed = time.perf_counter() - start
+
+    throughput = total_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {len(jobs) - failures}/{len(jobs)} files, {total_bytes} bytes in {elapsed:.2f}s "
+          f"({throughput:.2f} MB/s, {len(jobs) / elapsed if elapsed > 0 else 0.0:.1f} files/s) "
+          f"with {args.workers} workers.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
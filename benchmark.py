@@ -0,0 +1,270 @@
+# File: benchmark.py
+
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from engine.data import Data
+from engine.recipe import INVERSE_OPERATIONS, KEY_PAIR_INVERSES, RecipeStep
+from engine.recipe_engine import RecipeEngine
+from operations.asymmetric_ciphers import ed25519_key_gen, rsa_key_gen, x25519_key_gen
+from operations.ciphers import SUBSTITUTION_LETTERS
+from operations.steganography_core import encode_lsb, decode_lsb
+
+# --- Constants ---
+DEFAULT_SIZES = "1K,16K,256K,1M,16M,100M"
+DEFAULT_IMAGE_SIZES = "64,256,1024"
+DEFAULT_MAX_SECONDS = 10.0
+DEFAULT_MAX_MEMORY_MB = 512
+DEFAULT_THRESHOLD = 0.2
+MIN_MEASURE_SECONDS = 0.2
+MAX_REPEATS = 50
+PEM_BLOCK = re.compile(r"-----BEGIN (PUBLIC|PRIVATE) KEY-----\n[A-Za-z0-9+/=\n]+-----END \1 KEY-----")
+SAMPLE_TEXT = "The Quick Brown Fox Jumps Over The Lazy Dog, 1234567890. "
+
+# Operations whose input size is capped (RSA-OAEP) or irrelevant (key generation).
+FIXED_SIZE_OPERATIONS = {"RSA Encrypt": 128, "RSA Decrypt": 128, "RSA Key Gen": 0,
+                         "Ed25519 Key Gen": 0, "X25519 Key Gen": 0}
+
+
+def parse_size(text: str) -> int:
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def make_text(size: int) -> str:
+    return (SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 1))[:size]
+
+
+def key_pair_pems(key_gen) -> tuple[str, str]:
+    """The public and private key PEM blocks of a freshly generated key pair."""
+    success, key_pair = key_gen()
+    if not success:
+        raise RuntimeError(key_pair)
+    public_pem, private_pem = (match.group(0) for match in PEM_BLOCK.finditer(key_pair))
+    return public_pem, private_pem
+
+
+def benchmark_args() -> dict[str, dict]:
+    """Arguments used for every parameterised operation, for both modes."""
+    public_pem, private_pem = key_pair_pems(rsa_key_gen)
+    ed25519_public, ed25519_private = key_pair_pems(ed25519_key_gen)
+    x25519_public, x25519_private = key_pair_pems(x25519_key_gen)
+    return {
+        "Caesar Encrypt": {"shift": "3"}, "Caesar Decrypt": {"shift": "3"},
+        "Vigenère Cipher": {"key": "LEMON"},
+        "Substitution Cipher": {"alphabet": SUBSTITUTION_LETTERS[::-1]},
+        "AES Encrypt": {"key": "k" * 16}, "AES Decrypt": {"key": "k" * 16},
+        "DES Encrypt": {"key": "k" * 8}, "DES Decrypt": {"key": "k" * 8},
+        "Triple DES Encrypt": {"key": "k" * 24}, "Triple DES Decrypt": {"key": "k" * 24},
+        "Blowfish Encrypt": {"key": "k" * 16}, "Blowfish Decrypt": {"key": "k" * 16},
+        "AES-GCM Encrypt": {"key": "k" * 32}, "AES-GCM Decrypt": {"key": "k" * 32},
+        "RSA Encrypt": {"key": public_pem}, "RSA Decrypt": {"key": private_pem},
+        "RSA Envelope Encrypt": {"key": public_pem},
+        "Ed25519 Sign": {"key": ed25519_private}, "Ed25519 Verify": {"key": ed25519_public},
+        "X25519 Seal": {"key": x25519_public}, "X25519 Open": {"key": x25519_private},
+        "Password Encrypt": {"password": "benchmark"}, "Password Decrypt": {"password": "benchmark"},
+    }
+
+
+def time_call(func) -> float:
+    """Best-of wall time of func(), repeated until MIN_MEASURE_SECONDS have passed (at least once)."""
+    best, total, repeats = float("inf"), 0.0, 0
+    while repeats < MAX_REPEATS and (repeats == 0 or total < MIN_MEASURE_SECONDS):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeats += 1
+    return best
+
+
+def make_result(mode, operation, size, input_bytes, seconds, status="ok"):
+    return {
+        "mode": mode,
+        "operation": operation,
+        "size": size,
+        "input_bytes": input_bytes,
+        "seconds": seconds,
+        "mb_per_s": input_bytes / (1024 * 1024) / seconds if seconds and input_bytes else None,
+        "ops_per_s": 1 / seconds if seconds else None,
+        "status": status,
+    }
+
+
+def operation_input(mode, name, size, args, encrypt_engine):
+    """Input for an operation: plain text for encrypt mode, the encrypted form of plain text for decrypt mode."""
+    text = make_text(size)
+    if mode == "encrypt":
+        return Data.of(text)
+    inverse = INVERSE_OPERATIONS.get(name) or KEY_PAIR_INVERSES.get(name, name)
+    success, data = encrypt_engine.run_step(RecipeStep(inverse, args.get(inverse, args.get(name, {}))), text)
+    if not success:
+        raise RuntimeError(f"Could not prepare input for {name}: {data}")
+    return data
+
+
+def run_operation_benchmarks(sizes, max_seconds, only=None, log=print,
+                             max_memory_mb=DEFAULT_MAX_MEMORY_MB) -> list[dict]:
+    """
+    Times every operation at every size. A size is skipped when the last
+    successful size projects it past `max_seconds`, or its input plus
+    output past `max_memory_mb` (encoders such as To Binary grow their
+    data eightfold, and decrypt-mode inputs are built before timing).
+    """
+    args = benchmark_args()
+    encrypt_engine = RecipeEngine("encrypt")
+    results = []
+    for mode in ("encrypt", "decrypt"):
+        engine = RecipeEngine(mode)
+        for name in engine.operations:
+            if only and name not in only:
+                continue
+            step = RecipeStep(name, args.get(name, {}))
+            op_sizes = [FIXED_SIZE_OPERATIONS[name]] if name in FIXED_SIZE_OPERATIONS else sizes
+            previous = None
+            for size in op_sizes:
+                if previous is not None:
+                    prev_size, prev_seconds, prev_footprint = previous
+                    scale = size / max(prev_size, 1)
+                    projected = prev_seconds * scale
+                    if projected > max_seconds:
+                        results.append(make_result(mode, name, size, None, None, "skipped (too slow)"))
+                        log(f"{mode:8} {name:22} {size:>12,} B  skipped, projected {projected:.1f}s")
+                        continue
+                    projected_mb = prev_footprint * scale / (1024 * 1024)
+                    if projected_mb > max_memory_mb:
+                        results.append(make_result(mode, name, size, None, None, "skipped (too much memory)"))
+                        log(f"{mode:8} {name:22} {size:>12,} B  skipped, projected {projected_mb:.0f} MB")
+                        continue
+                data = operation_input(mode, name, size, args, encrypt_engine)
+                outcome = {}
+
+                def run():
+                    outcome["result"] = engine.run_step(step, data)
+
+                seconds = time_call(run)
+                success, message = outcome["result"]
+                if not success:
+                    # A failure times the error path, which says nothing about the operation.
+                    results.append(make_result(mode, name, size, len(data), None, f"failed: {message}"))
+                    log(f"{mode:8} {name:22} {size:>12,} B  failed: {message}")
+                    continue
+                result = make_result(mode, name, size, len(data), seconds)
+                results.append(result)
+                previous = (size, seconds, len(data) + len(message))
+                rate = f"{result['mb_per_s']:10.2f} MB/s" if result["mb_per_s"] else " " * 15
+                log(f"{mode:8} {name:22} {size:>12,} B  {seconds * 1000:10.3f} ms {rate} "
+                    f"{result['ops_per_s']:10.1f} ops/s  ok")
+    return results
+
+
+def run_steganography_benchmarks(image_sizes, log=print) -> list[dict]:
+    rng = np.random.default_rng(0)
+    results = []
+    for side in image_sizes:
+        image = rng.integers(0, 256, size=(side, side, 3), dtype=np.uint8)
+        # A payload filling about a tenth of the image's LSB capacity.
+        payload = make_text(max(1, image.size // 8 // 10))
+        encoded = encode_lsb(image, payload)
+        for name, func in (("encode_lsb", lambda: encode_lsb(image, payload)),
+                           ("decode_lsb", lambda: decode_lsb(encoded))):
+            seconds = time_call(func)
+            result = make_result("steganography", name, side, image.size, seconds)
+            result["payload_bytes"] = len(payload)
+            results.append(result)
+            log(f"{'stego':8} {name:22} {side:>5}x{side:<6}  {seconds * 1000:10.3f} ms "
+                f"{result['mb_per_s']:10.2f} MB/s {result['ops_per_s']:10.1f} ops/s")
+    return results
+
+
+def compare_results(results, baseline, threshold) -> list[str]:
+    """
+    Lists every measurement whose throughput dropped by more than `threshold`
+    versus the baseline. Only runs that succeeded in both are compared.
+    """
+    def key(result):
+        return result["mode"], result["operation"], result["size"]
+
+    baseline_by_key = {key(result): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = baseline_by_key.get(key(result))
+        if not old or old.get("status") != "ok" or result.get("status") != "ok":
+            continue
+        if not old.get("seconds") or not result.get("seconds"):
+            continue
+        slowdown = result["seconds"] / old["seconds"] - 1
+        if slowdown > threshold:
+            regressions.append(f"{result['mode']} {result['operation']} @ {result['size']}: "
+                               f"{old['seconds'] * 1000:.3f} ms -> {result['seconds'] * 1000:.3f} ms "
+                               f"({slowdown:+.0%})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every CryptoSuite operation.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated input sizes, e.g. 1K,1M,100M.")
+    parser.add_argument("--image-sizes", default=DEFAULT_IMAGE_SIZES,
+                        help="Comma-separated square image sizes (pixels per side) for steganography.")
+    parser.add_argument("--operations", help="Comma-separated operation names to run (default: all).")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="Skip sizes whose projected single-run time exceeds this.")
+    parser.add_argument("--max-memory-mb", type=float, default=DEFAULT_MAX_MEMORY_MB,
+                        help="Skip sizes whose projected input plus output exceeds this many MB.")
+    parser.add_argument("-o", "--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown ratio counted as a regression (0.2 = 20%% slower).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    image_sizes = [int(size) for size in args.image_sizes.split(",") if size.strip()]
+    only = set(name.strip() for name in args.operations.split(",")) if args.operations else None
+
+    results = run_operation_benchmarks(sizes, args.max_seconds, only, max_memory_mb=args.max_memory_mb)
+    if not only or only & {"encode_lsb", "decode_lsb"}:
+        results += run_steganography_benchmarks(image_sizes)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions against {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
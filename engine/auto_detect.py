@@ -0,0 +1,245 @@
+# File: engine/auto_detect.py
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine.data import Data
+from engine.format_classifier import FORMAT_OPERATIONS, classify_input
+from engine.optimizer import describe_step
+from engine.recipe import RecipeStep
+from engine.step_cache import step_key
+from operations.cryptanalysis import chi_squared_by_shift, crack_vigenere, letter_indices
+
+# --- Constants ---
+DEFAULT_BEAM_WIDTH = 6
+DEFAULT_MAX_DEPTH = 4
+DEFAULT_TIME_BUDGET = 2.0
+DEFAULT_WORKERS = 4
+DEFAULT_RESULTS = 8
+# How often, in seconds, the search checks for cancellation while waiting on expansions.
+CANCEL_POLL_SECONDS = 0.1
+CAESAR_CANDIDATES = 2
+VIGENERE_MIN_LETTERS = 200
+SCORE_SAMPLE_BYTES = 64 * 1024
+RECIPE_LENGTH_PENALTY = 0.01
+
+# The most frequent English letter pairs; together they cover roughly a third of the bigrams in English text.
+COMMON_BIGRAMS = ["th", "he", "in", "er", "an", "re", "nd", "on", "en", "at", "ou", "ed", "ha", "to", "or",
+                  "it", "is", "hi", "es", "ng", "st", "ar", "te", "se", "me", "ve", "of", "le", "al", "nt"]
+COMMON_BIGRAM_CODES = np.array([(ord(pair[0]) - ord('a')) * 26 + ord(pair[1]) - ord('a') for pair in COMMON_BIGRAMS])
+ENGLISH_BIGRAM_COVERAGE = 0.35
+ENGLISH_ENTROPY = 4.2
+
+# Byte values that count as printable: tab, newline, carriage return and ASCII 0x20-0x7E.
+PRINTABLE_BYTES = np.zeros(256, dtype=bool)
+PRINTABLE_BYTES[[9, 10, 13]] = True
+PRINTABLE_BYTES[0x20:0x7F] = True
+
+# Substitutions on letters; two in a row are never tried since they compose into one.
+LETTER_SUBSTITUTIONS = {"ROT13 Cipher", "Atbash Cipher", "Caesar Decrypt", "Vigenère Cipher"}
+DECODERS = ["From Base64", "From Hex", "From Binary", "From Morse Code"]
+
+
+def printable_ratio(raw: bytes, is_text: bool) -> float:
+    """Share of printable bytes; bytes of non-ASCII characters count as printable in valid UTF-8 text."""
+    if not raw:
+        return 0.0
+    buffer = np.frombuffer(raw, dtype=np.uint8)
+    printable = PRINTABLE_BYTES[buffer]
+    if is_text:
+        printable |= buffer >= 0x80
+    return float(np.count_nonzero(printable)) / len(buffer)
+
+
+def byte_entropy(raw: bytes) -> float:
+    """Shannon entropy of the byte histogram, in bits per byte."""
+    if not raw:
+        return 0.0
+    counts = np.bincount(np.frombuffer(raw, dtype=np.uint8), minlength=256)
+    probabilities = counts[counts > 0] / len(raw)
+    return float(-np.sum(probabilities * np.log2(probabilities)))
+
+
+def ngram_fitness(raw: bytes) -> float:
+    """
+    How English the letters look, from 0 to 1: the unigram chi-squared
+    fit averaged with the share of letter pairs that are common English
+    bigrams.
+    """
+    indices = letter_indices(raw)
+    if len(indices) < 2:
+        return 0.0
+    chi_per_letter = float(chi_squared_by_shift(indices)[0]) / len(indices)
+    unigram = 1 / (1 + 4 * chi_per_letter)
+    codes = indices[:-1].astype(np.int32) * 26 + indices[1:]
+    coverage = np.count_nonzero(np.isin(codes, COMMON_BIGRAM_CODES)) / len(codes)
+    bigram = min(coverage / ENGLISH_BIGRAM_COVERAGE, 1.0)
+    return float(unigram + bigram) / 2
+
+
+def score_data(data: Data) -> float:
+    """
+    Scores how much a value looks like readable text, from 0 to 1.
+
+    Combines the printable ratio, closeness of the byte entropy to that of
+    English, n-gram fitness and the share of letters, over a sample of at
+    most SCORE_SAMPLE_BYTES.
+    """
+    raw = data.raw[:SCORE_SAMPLE_BYTES]
+    if not raw:
+        return 0.0
+    printable = printable_ratio(raw, data.is_text())
+    entropy_fit = max(0.0, 1 - abs(byte_entropy(raw) - ENGLISH_ENTROPY) / 4)
+    letter_ratio = len(letter_indices(raw)) / len(raw)
+    return float(printable * (0.2 * entropy_fit + 0.6 * ngram_fitness(raw) + 0.2 * min(letter_ratio / 0.7, 1.0)))
+
+
+@dataclass
+class DetectionCandidate:
+    """A recipe found by auto-detect, with its output and score."""
+    steps: list[RecipeStep]
+    data: Data
+    score: float
+
+    def describe(self) -> str:
+        return " → ".join(describe_step(step) for step in self.steps)
+
+    def preview(self, length: int = 80) -> str:
+        text = self.data.display_text()[:length]
+        return " ".join(text.split())
+
+
+class AutoDetector:
+    """
+    Finds the decoding recipe that turns an input into readable text.
+
+    Runs a beam search over the decoders, ROT13, Atbash, the best Caesar
+    shifts and a solved Vigenère key: every candidate in the beam is
+    expanded with every operation in a thread pool, each output is scored
+    with score_data, and the best `beam_width` distinct outputs form the
+    next beam. The search stops at `max_depth` steps or when
+    `time_budget` seconds have passed. Decodes are memoized by input
+    digest and step, so branches that reach the same data share work.
+    """
+
+    def __init__(self, engine, beam_width: int = DEFAULT_BEAM_WIDTH, max_depth: int = DEFAULT_MAX_DEPTH,
+                 time_budget: float = DEFAULT_TIME_BUDGET, workers: int = DEFAULT_WORKERS):
+        self.engine = engine
+        self.beam_width = beam_width
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.workers = workers
+        self._memo = {}
+
+    @staticmethod
+    def digest(data: Data) -> bytes:
+        return hashlib.sha256(data.raw).digest()
+
+    def run_step(self, step: RecipeStep, data: Data, digest: bytes):
+        """engine.run_step() memoized by input digest and step."""
+        key = (digest, step_key(step))
+        if key not in self._memo:
+            self._memo[key] = self.engine.run_step(step, data)
+        return self._memo[key]
+
+    def next_steps(self, candidate: DetectionCandidate) -> list[RecipeStep]:
+        """The operations worth trying after a candidate's recipe."""
+        # Only decoders whose format the classifier finds plausible are tried.
+        likely = {FORMAT_OPERATIONS.get(name) for name in classify_input(candidate.data).likely()}
+        steps = [RecipeStep(name) for name in DECODERS if name in likely and name in self.engine.operations]
+        last = candidate.steps[-1].operation if candidate.steps else None
+        if last in LETTER_SUBSTITUTIONS or not candidate.data.is_text():
+            return steps
+        indices = letter_indices(candidate.data.raw[:SCORE_SAMPLE_BYTES])
+        if not len(indices):
+            return steps
+        steps += [RecipeStep("ROT13 Cipher"), RecipeStep("Atbash Cipher")]
+        scores = chi_squared_by_shift(indices)
+        shifts = [shift for shift in np.argsort(scores) if shift not in (0, 13)][:CAESAR_CANDIDATES]
+        steps += [RecipeStep("Caesar Decrypt", {"shift": str(shift)}) for shift in shifts]
+        if len(indices) >= VIGENERE_MIN_LETTERS and "Vigenère Cipher" in self.engine.operations:
+            success, keys = crack_vigenere(candidate.data.text[:SCORE_SAMPLE_BYTES], candidates=2, workers=1)
+            if success and len(keys[0][0]) > 1:
+                steps.append(RecipeStep("Vigenère Cipher", {"key": keys[0][0]}))
+        return [step for step in steps if step.operation in self.engine.operations]
+
+    def expand(self, candidate: DetectionCandidate, digest: bytes, deadline: float,
+               token=None) -> list[DetectionCandidate]:
+        """Runs every next step on a candidate, stopping early at the deadline or on cancellation."""
+        def stopped():
+            return time.monotonic() > deadline or (token is not None and token.cancelled)
+
+        children = []
+        if stopped():
+            return children
+        for step in self.next_steps(candidate):
+            if stopped():
+                break
+            success, result = self.run_step(step, candidate.data, digest)
+            if success and len(result):
+                score = score_data(result) - RECIPE_LENGTH_PENALTY * (len(candidate.steps) + 1)
+                children.append(DetectionCandidate(candidate.steps + [step], result, score))
+        return children
+
+    def detect(self, data, token=None, limit: int = DEFAULT_RESULTS) -> list[DetectionCandidate]:
+        """
+        Searches for decoding recipes.
+
+        Args:
+            data: The input, as Data, text or raw bytes.
+            token (CancellationToken): Checked between search levels.
+            limit (int): How many candidates to return.
+
+        Returns:
+            Candidates whose output scores better than the input, best first.
+        """
+        deadline = time.monotonic() + self.time_budget
+        root = DetectionCandidate([], Data.of(data), 0.0)
+        root.score = score_data(root.data)
+        seen = {self.digest(root.data)}
+        beam, found = [root], []
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for _ in range(self.max_depth):
+                if token is not None:
+                    token.raise_if_cancelled()
+                futures = [executor.submit(self.expand, candidate, self.digest(candidate.data), deadline, token)
+                           for candidate in beam]
+                children = []
+                pending = set(futures)
+                while pending and time.monotonic() < deadline:
+                    if token is not None:
+                        token.raise_if_cancelled()
+                    timeout = min(deadline - time.monotonic(), CANCEL_POLL_SECONDS)
+                    done, pending = wait(pending, timeout=max(timeout, 0), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        children += future.result()
+
+                next_beam = []
+                for child in sorted(children, key=lambda child: child.score, reverse=True):
+                    digest = self.digest(child.data)
+                    if digest in seen:
+                        continue
+                    seen.add(digest)
+                    found.append(child)
+                    if len(next_beam) < self.beam_width:
+                        next_beam.append(child)
+                beam = next_beam
+                if not beam or time.monotonic() >= deadline:
+                    break
+        finally:
+            # Running expansions see the deadline or the cancelled token and return after their current step.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        found = [candidate for candidate in found if candidate.score > root.score]
+        return sorted(found, key=lambda candidate: candidate.score, reverse=True)[:limit]
+
+
+def auto_detect(engine, data, token=None, **kwargs) -> list[DetectionCandidate]:
+    """Runs an AutoDetector with the given options on the data."""
+    return AutoDetector(engine, **kwargs).detect(data, token=token)
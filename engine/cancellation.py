@@ -0,0 +1,30 @@
+# File: engine/cancellation.py
+
+import threading
+
+
+class OperationCancelled(Exception):
+    """Raised when a bake or stream notices that its CancellationToken was cancelled."""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between the GUI and a worker.
+
+    The engine checks it between steps and the streaming pipeline between
+    chunks, so cancelling stops work at the next check point.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled("Operation cancelled.")
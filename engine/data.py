@@ -0,0 +1,74 @@
+# File: engine/data.py
+
+from typing import Union
+
+
+class Data:
+    """
+    The value passed between recipe steps.
+
+    Holds raw bytes and/or text and converts between them lazily (UTF-8),
+    at most once each way, so byte-oriented steps can be chained without
+    decoding and re-encoding at every step boundary.
+    """
+
+    __slots__ = ("_raw", "_text")
+
+    def __init__(self, raw: bytes = None, text: str = None):
+        if raw is None and text is None:
+            raise ValueError("Data needs either raw bytes or text.")
+        self._raw = raw
+        self._text = text
+
+    @classmethod
+    def of(cls, value: Union["Data", str, bytes]) -> "Data":
+        if isinstance(value, Data):
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return cls(raw=bytes(value))
+        return cls(text=value)
+
+    @property
+    def raw(self) -> bytes:
+        if self._raw is None:
+            self._raw = self._text.encode('utf-8')
+        return self._raw
+
+    @property
+    def text(self) -> str:
+        """The UTF-8 text view. Raises UnicodeDecodeError for binary data."""
+        if self._text is None:
+            self._text = self._raw.decode('utf-8')
+        return self._text
+
+    def is_text(self) -> bool:
+        """True if the data is valid UTF-8 text."""
+        try:
+            self.text
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def display_text(self) -> str:
+        """Text for showing in the GUI; undecodable bytes are replaced rather than failing."""
+        if self.is_text():
+            return self._text
+        return self._raw.decode('utf-8', errors='replace')
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __eq__(self, other):
+        if not isinstance(other, Data):
+            return NotImplemented
+        if self._text is not None and other._text is not None:
+            return self._text == other._text
+        return self.raw == other.raw
+
+    def __hash__(self):
+        return hash(self.raw)
+
+    def __repr__(self):
+        if self._text is not None:
+            return f"Data(text={self._text[:40]!r})"
+        return f"Data(raw={self._raw[:40]!r})"
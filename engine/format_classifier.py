@@ -0,0 +1,167 @@
+# File: engine/format_classifier.py
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from engine.data import Data
+
+# --- Constants ---
+FORMATS = ("base64", "hex", "iv_ciphertext_hex", "binary_digits", "morse", "pem", "text", "raw_bytes")
+
+# The decode operation for each format that has one.
+FORMAT_OPERATIONS = {
+    "base64": "From Base64",
+    "hex": "From Hex",
+    "iv_ciphertext_hex": "From Hex",
+    "binary_digits": "From Binary",
+    "morse": "From Morse Code",
+}
+
+# Block ciphers whose encrypt operations output iv.hex() + ct.hex(): (name, block size in bytes).
+BLOCK_CIPHERS = (("AES", 16), ("DES/Triple DES/Blowfish", 8))
+
+
+def _byte_class(characters: bytes) -> np.ndarray:
+    mask = np.zeros(256, dtype=bool)
+    mask[np.frombuffer(characters, dtype=np.uint8)] = True
+    return mask
+
+
+DIGITS = b"0123456789"
+LETTERS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+WHITESPACE_CLASS = _byte_class(b" \t\r\n")
+SPACE_CLASS = _byte_class(b" \t")
+HEX_CLASS = _byte_class(DIGITS + b"abcdefABCDEF")
+HEX_DIGIT_CLASSES = [_byte_class(bytes({digit, ord(chr(digit).upper())})) for digit in DIGITS + b"abcdef"]
+BASE64_CLASS = _byte_class(LETTERS + DIGITS + b"+/=")
+BINARY_CLASS = _byte_class(b"01")
+MORSE_CLASS = _byte_class(b".-/")
+PRINTABLE_CLASS = _byte_class(bytes(range(0x20, 0x7F)) + b"\t\r\n")
+NON_ASCII_CLASS = _byte_class(bytes(range(0x80, 0x100)))
+LETTER_CLASS = _byte_class(LETTERS)
+
+
+@dataclass
+class FormatReport:
+    """What an input looks like: a probability for each of FORMATS plus human-readable hints."""
+    probabilities: dict[str, float]
+    hints: list[str] = field(default_factory=list)
+
+    @property
+    def best(self) -> str:
+        return max(self.probabilities, key=self.probabilities.get)
+
+    def likely(self, threshold: float = 0.05) -> list[str]:
+        """Formats at or above `threshold`, most likely first."""
+        return [name for name in sorted(self.probabilities, key=self.probabilities.get, reverse=True)
+                if self.probabilities[name] >= threshold]
+
+
+def _count(histogram: np.ndarray, byte_class: np.ndarray) -> int:
+    return int(histogram[byte_class].sum())
+
+
+def hex_digit_uniformity(histogram: np.ndarray) -> float:
+    """1 when all 16 hex digits are equally frequent (as in ciphertext), falling towards 0 as they skew."""
+    counts = np.array([_count(histogram, digit_class) for digit_class in HEX_DIGIT_CLASSES], dtype=float)
+    total = float(counts.sum())
+    if total < 32:
+        return 0.5
+    expected = total / 16
+    chi_per_digit = float(np.sum((counts - expected) ** 2 / expected)) / total
+    return 1 / (1 + 8 * chi_per_digit)
+
+
+def classify_input(data) -> FormatReport:
+    """
+    Guesses the encoding of an input from a single byte histogram, without decoding it.
+
+    The whole input is counted once with np.bincount; everything else is
+    derived from the 256 counts plus checks on the first and last bytes
+    (PEM header, Base64 padding).
+
+    Args:
+        data: The input, as Data, text or raw bytes.
+
+    Returns:
+        A FormatReport with probabilities summing to 1.
+    """
+    raw = Data.of(data).raw
+    scores = dict.fromkeys(FORMATS, 0.0)
+    hints = []
+    if not raw:
+        scores["text"] = 1.0
+        return FormatReport(scores, ["Input is empty."])
+
+    histogram = np.bincount(np.frombuffer(raw, dtype=np.uint8), minlength=256)
+    total = len(raw)
+    whitespace = _count(histogram, WHITESPACE_CLASS)
+    content = total - whitespace
+    printable = _count(histogram, PRINTABLE_CLASS)
+
+    if raw.lstrip()[:11] == b"-----BEGIN ":
+        scores["pem"] = 1.0
+        hints.append("Starts with a PEM header (key or certificate).")
+
+    if content and _count(histogram, BINARY_CLASS) == content:
+        if content % 8 == 0:
+            scores["binary_digits"] = 1.0
+            hints.append(f"Only 0/1 digits, {content // 8} whole bytes.")
+        else:
+            scores["binary_digits"] = 0.3
+            hints.append(f"Only 0/1 digits, but {content} is not a multiple of 8.")
+
+    if content and _count(histogram, MORSE_CLASS) == content:
+        scores["morse"] = 1.0
+        hints.append("Only dots, dashes and slashes.")
+
+    hex_digits = _count(histogram, HEX_CLASS)
+    if content and hex_digits == content and not scores["binary_digits"]:
+        if content % 2:
+            scores["hex"] = 0.2
+            hints.append(f"Hex digits only, but odd length ({content}).")
+        else:
+            size = content // 2
+            uniformity = hex_digit_uniformity(histogram)
+            scores["hex"] = 1.0
+            hints.append(f"Hex of {size} bytes.")
+            for cipher, block in BLOCK_CIPHERS:
+                if size >= 2 * block and size % block == 0:
+                    hints.append(f"Hex length fits an IV plus {size // block - 1} whole "
+                                 f"{block}-byte blocks ({cipher}).")
+                    scores["iv_ciphertext_hex"] = 1.5 * uniformity
+            if scores["iv_ciphertext_hex"]:
+                scores["hex"] = 1.5 * (1 - uniformity)
+                shape = "even, like ciphertext" if uniformity > 0.5 else "uneven, like encoded text"
+                hints.append(f"Hex digit frequencies are {shape}.")
+
+    base64_chars = _count(histogram, BASE64_CLASS)
+    if content and base64_chars == content and not scores["binary_digits"]:
+        padding = int(histogram[ord("=")])
+        stripped = raw.rstrip()
+        padded_correctly = padding <= 2 and stripped.endswith(b"=" * padding)
+        inner_spaces = _count(histogram, SPACE_CLASS) - (len(raw) - len(raw.rstrip(b" \t")))
+        score = 1.0 if content % 4 == 0 and padded_correctly else 0.1
+        if inner_spaces:
+            score *= 0.2
+        if scores["hex"] or scores["iv_ciphertext_hex"]:
+            score *= 0.3
+        scores["base64"] = score
+        if content % 4 == 0 and padded_correctly:
+            hints.append(f"Base64 of {content // 4 * 3 - padding} bytes.")
+
+    non_ascii = _count(histogram, NON_ASCII_CLASS)
+    if printable + non_ascii == total:
+        letters = _count(histogram, LETTER_CLASS) + non_ascii
+        spaces = _count(histogram, SPACE_CLASS)
+        # Prose has frequent spaces and mostly letters; encodings have neither.
+        scores["text"] = 0.2 + 0.8 * min(1.0, spaces / total * 6) * (letters / max(content, 1))
+        if non_ascii:
+            hints.append("Contains non-ASCII characters, probably UTF-8 text.")
+    else:
+        scores["raw_bytes"] = 1.0
+        hints.append(f"{total - printable - non_ascii} control bytes; looks like raw binary data.")
+
+    norm = sum(scores.values()) or 1.0
+    return FormatReport({name: score / norm for name, score in scores.items()}, hints)
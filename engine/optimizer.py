@@ -0,0 +1,143 @@
+# File: engine/optimizer.py
+
+from dataclasses import dataclass, field
+
+from engine.recipe import RecipeStep
+from operations.ciphers import SUBSTITUTION_LETTERS
+
+IDENTITY_TABLE = SUBSTITUTION_LETTERS
+
+
+def caesar_table(shift: int) -> str:
+    """The substitution alphabet of a Caesar shift (a-z then A-Z)."""
+    shift %= 26
+    lower = SUBSTITUTION_LETTERS[:26]
+    upper = SUBSTITUTION_LETTERS[26:]
+    return lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+
+
+ATBASH_TABLE = SUBSTITUTION_LETTERS[:26][::-1] + SUBSTITUTION_LETTERS[26:][::-1]
+CAESAR_TABLES = {caesar_table(shift): shift for shift in range(26)}
+
+
+def compose_tables(first: str, second: str) -> str:
+    """The single table equivalent to applying `first` and then `second`."""
+    return first.translate(str.maketrans(SUBSTITUTION_LETTERS, second))
+
+
+@dataclass
+class OptimizedRecipe:
+    """The result of optimizing a recipe, with notes on every rewrite for explain mode."""
+    original: list[RecipeStep]
+    steps: list[RecipeStep]
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def passes_saved(self) -> int:
+        """How many fewer operations the optimized recipe runs."""
+        return len(self.original) - len(self.steps)
+
+    def explain(self) -> str:
+        lines = ["Original plan:"]
+        lines += [f"  {i + 1}. {describe_step(step)}" for i, step in enumerate(self.original)]
+        lines.append("Optimized plan:")
+        lines += [f"  {i + 1}. {describe_step(step)}" for i, step in enumerate(self.steps)] or ["  (no operations)"]
+        if self.notes:
+            lines.append("Rewrites:")
+            lines += [f"  - {note}" for note in self.notes]
+        lines.append(f"Passes saved: {self.passes_saved}")
+        return "\n".join(lines)
+
+
+def describe_step(step: RecipeStep) -> str:
+    if not step.args:
+        return step.operation
+    args = ", ".join(f"{name}={value}" for name, value in step.args.items())
+    return f"{step.operation}({args})"
+
+
+class RecipeOptimizer:
+    """
+    Rewrites a recipe into a cheaper equivalent before it runs.
+
+    Runs of letter-substitution steps (Caesar, ROT13, Atbash and Substitution
+    Cipher) are composed into one table, which merges consecutive Caesar shifts
+    and drops self-inverse pairs. Only operations present in the engine's
+    registry are produced, and steps with invalid args are left alone so they
+    still report their error when run.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.caesar_name = "Caesar Decrypt" if engine.mode == "decrypt" else "Caesar Encrypt"
+
+    def step_table(self, step: RecipeStep):
+        """The substitution table of a step, or None if it is not a valid substitution step."""
+        name = step.operation
+        if name not in self.engine.operations:
+            return None
+        if name == "ROT13 Cipher":
+            return caesar_table(13)
+        if name == "Atbash Cipher":
+            return ATBASH_TABLE
+        if name in ("Caesar Encrypt", "Caesar Decrypt"):
+            try:
+                shift = int(step.args.get("shift"))
+            except (ValueError, TypeError):
+                return None
+            if not 1 <= shift <= 25:
+                return None
+            return caesar_table(-shift if name == "Caesar Decrypt" else shift)
+        if name == "Substitution Cipher":
+            alphabet = step.args.get("alphabet", "")
+            if len(alphabet) != len(SUBSTITUTION_LETTERS) or not set(alphabet) <= set(SUBSTITUTION_LETTERS):
+                return None
+            return alphabet
+        return None
+
+    def table_steps(self, table: str) -> list[RecipeStep]:
+        """The cheapest steps that apply a substitution table."""
+        if table == IDENTITY_TABLE:
+            return []
+        if table in CAESAR_TABLES:
+            shift = CAESAR_TABLES[table]
+            if shift == 13 and "ROT13 Cipher" in self.engine.operations:
+                return [RecipeStep("ROT13 Cipher")]
+            if self.caesar_name == "Caesar Decrypt":
+                shift = 26 - shift
+            return [RecipeStep(self.caesar_name, {"shift": str(shift)})]
+        if table == ATBASH_TABLE:
+            return [RecipeStep("Atbash Cipher")]
+        return [RecipeStep("Substitution Cipher", {"alphabet": table})]
+
+    def fold_substitutions(self, steps: list[RecipeStep], notes: list[str]) -> list[RecipeStep]:
+        result, i = [], 0
+        while i < len(steps):
+            table = self.step_table(steps[i])
+            end = i + 1
+            while table is not None and end < len(steps) and self.step_table(steps[end]) is not None:
+                table = compose_tables(table, self.step_table(steps[end]))
+                end += 1
+            if end - i < 2:
+                result.append(steps[i])
+                i += 1
+                continue
+            folded = self.table_steps(table)
+            run = " + ".join(describe_step(step) for step in steps[i:end])
+            if folded:
+                notes.append(f"Folded {run} into {describe_step(folded[0])}")
+            else:
+                notes.append(f"Cancelled {run} (identity)")
+            result += folded
+            i = end
+        return result
+
+    def optimize(self, steps: list[RecipeStep]) -> OptimizedRecipe:
+        # Every run is folded whole, so a single pass leaves nothing more to fold.
+        notes = []
+        return OptimizedRecipe(list(steps), self.fold_substitutions(list(steps), notes), notes)
+
+
+def optimize_recipe(engine, steps: list[RecipeStep]) -> OptimizedRecipe:
+    """Optimizes a recipe for the given engine's mode and registry."""
+    return RecipeOptimizer(engine).optimize(steps)
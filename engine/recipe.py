@@ -0,0 +1,91 @@
+# File: engine/recipe.py
+
+import json
+from dataclasses import dataclass, field
+
+# Maps each operation to the operation that undoes it, for "Load & Invert".
+INVERSE_OPERATIONS = {
+    "To Base64": "From Base64", "From Base64": "To Base64",
+    "To Hex": "From Hex", "From Hex": "To Hex",
+    "To Binary": "From Binary", "From Binary": "To Binary",
+    "Morse Code": "From Morse Code", "From Morse Code": "Morse Code",
+    "Caesar Encrypt": "Caesar Decrypt", "Caesar Decrypt": "Caesar Encrypt",
+    "Atbash Cipher": "Atbash Cipher", "ROT13 Cipher": "ROT13 Cipher",
+    "Vigenère Cipher": "Vigenère Cipher",
+    "AES Encrypt": "AES Decrypt", "AES Decrypt": "AES Encrypt",
+    "DES Encrypt": "DES Decrypt", "DES Decrypt": "DES Encrypt",
+    "Triple DES Encrypt": "Triple DES Decrypt", "Triple DES Decrypt": "Triple DES Encrypt",
+    "Blowfish Encrypt": "Blowfish Decrypt", "Blowfish Decrypt": "Blowfish Encrypt",
+    "AES-GCM Encrypt": "AES-GCM Decrypt", "AES-GCM Decrypt": "AES-GCM Encrypt",
+    "RSA Encrypt": "RSA Decrypt", "RSA Decrypt": "RSA Encrypt",
+    "RSA Envelope Encrypt": "RSA Decrypt",
+    "Password Encrypt": "Password Decrypt", "Password Decrypt": "Password Encrypt"
+}
+
+# Operations undone by their counterpart only with the other half of the key pair. A saved
+# recipe holds just the key it was run with, so "Load & Invert" leaves these out.
+KEY_PAIR_INVERSES = {
+    "Ed25519 Sign": "Ed25519 Verify", "Ed25519 Verify": "Ed25519 Sign",
+    "X25519 Seal": "X25519 Open", "X25519 Open": "X25519 Seal",
+}
+
+
+@dataclass
+class RecipeStep:
+    """A single step of a recipe: an operation name and its arguments."""
+    operation: str
+    args: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {"operation": self.operation, "args": dict(self.args)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecipeStep":
+        return cls(data.get("operation", ""), dict(data.get("args", {})))
+
+
+def recipe_from_data(recipe_data: list) -> list[RecipeStep]:
+    """Builds a list of steps from the JSON structure written by save_recipe."""
+    return [RecipeStep.from_dict(step) for step in recipe_data if step.get("operation")]
+
+
+def recipe_to_data(steps: list[RecipeStep]) -> list[dict]:
+    """Converts a list of steps back into its JSON structure."""
+    return [step.to_dict() for step in steps]
+
+
+def load_recipe_file(filepath: str) -> list[RecipeStep]:
+    """Reads a recipe JSON file."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return recipe_from_data(json.load(f))
+
+
+def save_recipe_file(steps: list[RecipeStep], filepath: str):
+    """Writes a recipe JSON file."""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(recipe_to_data(steps), f, indent=4)
+
+
+def invert_recipe(steps: list[RecipeStep]) -> tuple[list[RecipeStep], list[str]]:
+    """
+    Builds the recipe that undoes `steps`: inverse operations in reverse order.
+
+    Returns:
+        A tuple of the inverted steps and the names of operations that have no inverse.
+    """
+    inverted, skipped = [], []
+    for step in reversed(steps):
+        inverse_name = INVERSE_OPERATIONS.get(step.operation)
+        if inverse_name is None:
+            skipped.append(step.operation)
+            continue
+        inverted.append(RecipeStep(inverse_name, dict(step.args)))
+    return inverted, skipped
+
+
+def skipped_inverse_message(operation: str) -> str:
+    """Why an operation was left out of an inverted recipe."""
+    if operation in KEY_PAIR_INVERSES:
+        return (f"'{operation}' is undone by '{KEY_PAIR_INVERSES[operation]}' with the other key of the pair, "
+                f"which the recipe does not hold. Skipping; add that step with the matching key.")
+    return f"Could not find an inverse for '{operation}'. Skipping."
@@ -0,0 +1,73 @@
+# File: engine/recipe_engine.py
+
+from typing import Union
+
+from engine.data import Data
+from engine.recipe import RecipeStep
+from engine.registry import get_registry
+
+
+class RecipeEngine:
+    """
+    Runs recipes without any GUI involvement.
+
+    Operations are looked up by name in the registry for the given mode
+    ('encrypt' or 'decrypt'), so the same recipe can be baked from the GUI,
+    a script or a service. Values travel between steps as Data, so
+    bytes-native operations hand raw bytes to each other and text is only
+    decoded for operations that need it.
+    """
+
+    def __init__(self, mode: str = "encrypt"):
+        self.mode = mode
+        self.operations = get_registry(mode)
+
+    def run_step(self, step: RecipeStep, data: Union[Data, str, bytes]) -> tuple[bool, Union[Data, str]]:
+        """
+        Runs a single step on the given data.
+
+        Returns:
+            A tuple containing a boolean for success and either the result
+            as Data or an error message.
+        """
+        operation = self.operations.get(step.operation)
+        if operation is None:
+            return False, f"Unknown operation: {step.operation}"
+        data = Data.of(data)
+        if operation.bytes_native:
+            success, result = operation.run(data.raw, step.args)
+        elif data.is_text():
+            success, result = operation.run(data.text, step.args)
+        else:
+            return False, "Input is binary data, but this operation needs UTF-8 text."
+        if not success:
+            return False, result
+        return True, Data.of(result)
+
+    def bake(self, steps: list[RecipeStep], data: Union[Data, str, bytes], token=None,
+             progress=None) -> tuple[bool, Union[Data, str]]:
+        """
+        Runs every step in order, feeding each result into the next step.
+
+        Args:
+            steps (list): The recipe to run.
+            data: The input, as Data, text or raw bytes.
+            token (CancellationToken): Checked before every step; raises
+                                       OperationCancelled once cancelled.
+            progress (callable): Called as progress(index, total, step)
+                                 before each step runs.
+
+        Returns:
+            A tuple containing a boolean for success and either the final
+            result as Data or an error message naming the failing step.
+        """
+        data = Data.of(data)
+        for index, step in enumerate(steps):
+            if token is not None:
+                token.raise_if_cancelled()
+            if progress is not None:
+                progress(index, len(steps), step)
+            success, data = self.run_step(step, data)
+            if not success:
+                return False, f"Step '{step.operation}' failed: {data}"
+        return True, data
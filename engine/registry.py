@@ -0,0 +1,179 @@
+# File: engine/registry.py
+
+from dataclasses import dataclass
+from typing import Callable
+
+from operations.encoders import to_base64, from_base64
+from operations.hex import to_hex, from_hex
+from operations.text_converters import to_binary, from_binary, to_morse, from_morse
+from operations.ciphers import caesar_cipher, atbash_cipher, rot13_cipher, vigenere_cipher, substitution_cipher
+from operations.ciphers import aes_encrypt, des_encrypt, triple_des_encrypt, blowfish_encrypt
+from operations.ciphers import aes_decrypt, des_decrypt, triple_des_decrypt, blowfish_decrypt
+from operations.file_encryption import gcm_encrypt, gcm_decrypt
+from operations.asymmetric_ciphers import rsa_key_gen, rsa_encrypt, rsa_decrypt, rsa_envelope_encrypt
+from operations.asymmetric_ciphers import ed25519_key_gen, ed25519_sign, ed25519_verify
+from operations.asymmetric_ciphers import x25519_key_gen, x25519_seal, x25519_open
+from operations.key_pool import default_pool
+from operations.hashing_core import hash_md5, hash_sha1, hash_sha256, hash_sha512
+from operations.steganography_core import encrypt_message, decrypt_message
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A named recipe operation.
+
+    Attributes:
+        name (str): The name shown in the GUI and stored in recipe files.
+        run (Callable): Takes the input data and the step's args dict and
+                        returns a (success, result) tuple.
+        params (tuple): Names of the args this operation reads.
+        bytes_native (bool): If True, `run` also accepts raw bytes and then
+                             returns bytes, so the engine can skip text
+                             decoding between byte-oriented steps.
+        deterministic (bool): False for operations whose output changes from
+                              run to run (random IVs, salts or keys), so
+                              their results are never cached.
+    """
+    name: str
+    run: Callable[[str, dict], tuple[bool, str]]
+    params: tuple[str, ...] = ()
+    bytes_native: bool = False
+    deterministic: bool = True
+
+
+# --- Adapters from recipe args to the operations/ function signatures ---
+
+def _plain(func):
+    return lambda data, args: func(data)
+
+
+def _caesar(decrypt: bool):
+    def run(data, args):
+        try:
+            shift = int(args.get("shift"))
+        except (ValueError, TypeError):
+            return False, "Invalid shift value. Must be an integer."
+        if not 1 <= shift <= 25:
+            return False, "Shift must be between 1 and 25."
+        return caesar_cipher(data, shift, decrypt=decrypt)
+    return run
+
+
+def _keyed(func, empty_message=None, **kwargs):
+    def run(data, args):
+        key = args.get("key", "")
+        if empty_message and not key:
+            return False, empty_message
+        return func(data, key, **kwargs)
+    return run
+
+
+def _symmetric_encrypt(func):
+    """A block cipher encrypt operation; the optional "output" arg picks hex (default), base64 or raw."""
+    def run(data, args):
+        return func(data, args.get("key", ""), output=args.get("output") or "hex")
+    return run
+
+
+def _rsa_key_gen(data, args):
+    """Takes a pair from the default key pool when one is running; "key_size" defaults to 2048."""
+    try:
+        key_size = int(args.get("key_size") or 2048)
+    except ValueError:
+        return False, "RSA key size must be a number of bits."
+    return rsa_key_gen(key_size, pool=default_pool())
+
+
+def _substitution(data, args):
+    return substitution_cipher(data, args.get("alphabet", ""))
+
+
+def _password_decrypt(data, args):
+    result = decrypt_message(data, args.get("password", ""))
+    if result == "INVALID_PASSWORD":
+        return False, "Invalid password."
+    if result is None:
+        return False, "Failed to decrypt message."
+    return True, result
+
+
+def _registry(*operations: Operation) -> dict[str, Operation]:
+    return {operation.name: operation for operation in operations}
+
+
+ENCRYPT_OPERATIONS = _registry(
+    Operation("To Base64", _plain(to_base64), bytes_native=True),
+    Operation("To Hex", _plain(to_hex), bytes_native=True),
+    Operation("To Binary", _plain(to_binary)),
+    Operation("Morse Code", _plain(to_morse)),
+    Operation("Caesar Encrypt", _caesar(decrypt=False), ("shift",), bytes_native=True),
+    Operation("Atbash Cipher", _plain(atbash_cipher), bytes_native=True),
+    Operation("ROT13 Cipher", _plain(rot13_cipher), bytes_native=True),
+    Operation("Substitution Cipher", _substitution, ("alphabet",), bytes_native=True),
+    Operation("Vigenère Cipher", _keyed(vigenere_cipher, "Vigenère key cannot be empty.", decrypt=False), ("key",),
+              bytes_native=True),
+    Operation("AES Encrypt", _symmetric_encrypt(aes_encrypt), ("key", "output"), bytes_native=True,
+              deterministic=False),
+    Operation("DES Encrypt", _symmetric_encrypt(des_encrypt), ("key", "output"), bytes_native=True,
+              deterministic=False),
+    Operation("Triple DES Encrypt", _symmetric_encrypt(triple_des_encrypt), ("key", "output"), bytes_native=True,
+              deterministic=False),
+    Operation("Blowfish Encrypt", _symmetric_encrypt(blowfish_encrypt), ("key", "output"), bytes_native=True,
+              deterministic=False),
+    Operation("AES-GCM Encrypt", _keyed(gcm_encrypt), ("key",), bytes_native=True, deterministic=False),
+    Operation("RSA Encrypt", _keyed(rsa_encrypt, "RSA public key cannot be empty."), ("key",),
+              bytes_native=True, deterministic=False),
+    Operation("RSA Envelope Encrypt", _keyed(rsa_envelope_encrypt, "RSA public key cannot be empty."), ("key",),
+              bytes_native=True, deterministic=False),
+    Operation("RSA Key Gen", _rsa_key_gen, ("key_size",), deterministic=False),
+    Operation("Ed25519 Sign", _keyed(ed25519_sign, "Ed25519 private key cannot be empty."), ("key",),
+              bytes_native=True),
+    Operation("Ed25519 Key Gen", lambda data, args: ed25519_key_gen(), deterministic=False),
+    Operation("X25519 Seal", _keyed(x25519_seal, "X25519 public key cannot be empty."), ("key",),
+              bytes_native=True, deterministic=False),
+    Operation("X25519 Key Gen", lambda data, args: x25519_key_gen(), deterministic=False),
+    Operation("Password Encrypt", lambda data, args: (True, encrypt_message(data, args.get("password", ""))),
+              ("password",), deterministic=False),
+    Operation("MD5", _plain(hash_md5), bytes_native=True),
+    Operation("SHA-1", _plain(hash_sha1), bytes_native=True),
+    Operation("SHA-256", _plain(hash_sha256), bytes_native=True),
+    Operation("SHA-512", _plain(hash_sha512), bytes_native=True),
+)
+
+DECRYPT_OPERATIONS = _registry(
+    Operation("From Base64", _plain(from_base64), bytes_native=True),
+    Operation("From Hex", _plain(from_hex), bytes_native=True),
+    Operation("From Binary", _plain(from_binary)),
+    Operation("From Morse Code", _plain(from_morse)),
+    Operation("Caesar Decrypt", _caesar(decrypt=True), ("shift",), bytes_native=True),
+    Operation("Atbash Cipher", _plain(atbash_cipher), bytes_native=True),
+    Operation("ROT13 Cipher", _plain(rot13_cipher), bytes_native=True),
+    Operation("Substitution Cipher", _substitution, ("alphabet",), bytes_native=True),
+    Operation("Vigenère Cipher", _keyed(vigenere_cipher, "Vigenère key cannot be empty.", decrypt=True), ("key",),
+              bytes_native=True),
+    Operation("AES Decrypt", _keyed(aes_decrypt), ("key",), bytes_native=True),
+    Operation("DES Decrypt", _keyed(des_decrypt), ("key",), bytes_native=True),
+    Operation("Triple DES Decrypt", _keyed(triple_des_decrypt), ("key",), bytes_native=True),
+    Operation("Blowfish Decrypt", _keyed(blowfish_decrypt), ("key",), bytes_native=True),
+    Operation("AES-GCM Decrypt", _keyed(gcm_decrypt), ("key",), bytes_native=True),
+    Operation("RSA Decrypt", _keyed(rsa_decrypt, "RSA private key cannot be empty."), ("key",), bytes_native=True),
+    Operation("Ed25519 Verify", _keyed(ed25519_verify, "Ed25519 public key cannot be empty."), ("key",),
+              bytes_native=True),
+    Operation("X25519 Open", _keyed(x25519_open, "X25519 private key cannot be empty."), ("key",),
+              bytes_native=True),
+    Operation("Password Decrypt", _password_decrypt, ("password",)),
+)
+
+REGISTRIES = {
+    "encrypt": ENCRYPT_OPERATIONS,
+    "decrypt": DECRYPT_OPERATIONS,
+}
+
+
+def get_registry(mode: str) -> dict[str, Operation]:
+    """Returns the operation registry for 'encrypt' or 'decrypt' mode."""
+    try:
+        return REGISTRIES[mode]
+    except KeyError:
+        raise ValueError(f"Unknown recipe mode: {mode}") from None
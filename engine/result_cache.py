@@ -0,0 +1,111 @@
+# File: engine/result_cache.py
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from engine.data import Data
+from engine.recipe import RecipeStep, recipe_to_data
+
+# --- Constants ---
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def recipe_digest(mode: str, steps: list[RecipeStep]) -> str:
+    """A canonical hash of a recipe: mode, operations and args, independent of dict ordering."""
+    canonical = json.dumps([mode, recipe_to_data(steps)], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def is_cacheable(engine, steps: list[RecipeStep]) -> bool:
+    """False if any step is unknown or non-deterministic (random IVs, key generation...)."""
+    for step in steps:
+        operation = engine.operations.get(step.operation)
+        if operation is None or not operation.deterministic:
+            return False
+    return True
+
+
+class ResultCache:
+    """
+    Content-addressed cache of bake results with LRU eviction.
+
+    Entries are keyed by (SHA-256 of the input bytes, canonical hash of the
+    recipe) and evicted least-recently-used first once the cached results
+    exceed `max_bytes`. Recipes containing non-deterministic operations are
+    never cached. Safe to use from worker threads.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, engine, steps: list[RecipeStep], data) -> tuple[str, str]:
+        return hashlib.sha256(Data.of(data).raw).hexdigest(), recipe_digest(engine.mode, steps)
+
+    def lookup(self, engine, steps: list[RecipeStep], data):
+        """Returns the cached result Data, or None on a miss or for an uncacheable recipe."""
+        if not is_cacheable(engine, steps):
+            with self._lock:
+                self.uncacheable += 1
+            return None
+        key = self.key(engine, steps, data)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def store(self, engine, steps: list[RecipeStep], data, result: Data):
+        """Caches a successful result, evicting the least recently used entries to stay within budget."""
+        size = len(result)
+        if size > self.max_bytes or not is_cacheable(engine, steps):
+            return
+        key = self.key(engine, steps, data)
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= len(self._entries.pop(key))
+            self._entries[key] = result
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def bake(self, engine, steps: list[RecipeStep], data, **kwargs) -> tuple[bool, object]:
+        """engine.bake() behind the cache. Extra keyword arguments are passed to engine.bake()."""
+        data = Data.of(data)
+        result = self.lookup(engine, steps, data)
+        if result is not None:
+            return True, result
+        success, result = engine.bake(steps, data, **kwargs)
+        if success:
+            self.store(engine, steps, data, result)
+        return success, result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+            }
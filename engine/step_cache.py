@@ -0,0 +1,70 @@
+# File: engine/step_cache.py
+
+from typing import Union
+
+from engine.data import Data
+from engine.recipe import RecipeStep
+
+
+def step_key(step: RecipeStep) -> tuple:
+    """A hashable key for a step's operation and parameters."""
+    return step.operation, tuple(sorted((name, str(value)) for name, value in step.args.items()))
+
+
+class StepCache:
+    """
+    Memoizes the intermediate result of every step of a recipe.
+
+    Result i is valid as long as the input and steps 0..i are unchanged, so
+    stepping through a recipe runs exactly one new operation per step, and
+    editing step k only recomputes steps k and later.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._input = None
+        self._keys = []
+        self._results = []
+
+    def clear(self):
+        self._input = None
+        self._keys = []
+        self._results = []
+
+    def invalidate_from(self, index: int):
+        """Drops the cached results of step `index` and every step after it."""
+        del self._keys[index:]
+        del self._results[index:]
+
+    def _sync(self, steps: list[RecipeStep], data: str):
+        """Drops every cached result that no longer matches the input or the steps."""
+        if self._input is not data and self._input != data:
+            self.clear()
+            self._input = data
+            return
+        valid = 0
+        while valid < min(len(self._keys), len(steps)) and self._keys[valid] == step_key(steps[valid]):
+            valid += 1
+        self.invalidate_from(valid)
+
+    def run_to(self, steps: list[RecipeStep], data: str, index: int, token=None) -> tuple[bool, Union[Data, str]]:
+        """
+        Returns the result of steps 0..index, running only the steps not cached yet.
+
+        Returns:
+            A tuple containing a boolean for success and either the result of
+            step `index` as Data or an error message naming the failing step.
+            Raises OperationCancelled if `token` is cancelled between steps.
+        """
+        self._sync(steps, data)
+        current = self._results[-1] if self._results else data
+        for i in range(len(self._results), index + 1):
+            if token is not None:
+                token.raise_if_cancelled()
+            step = steps[i]
+            success, current = self.engine.run_step(step, current)
+            if not success:
+                return False, f"Step '{step.operation}' failed: {current}"
+            self._keys.append(step_key(step))
+            self._results.append(current)
+        return True, self._results[index]
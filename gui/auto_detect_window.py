@@ -0,0 +1,45 @@
+# File: gui/auto_detect_window.py
+
+import customtkinter
+
+
+class AutoDetectWindow(customtkinter.CTkToplevel):
+    """Lists auto-detect candidates, best first; clicking one hands it to `on_select` and closes the window."""
+
+    def __init__(self, master, candidates, on_select, **kwargs):
+        super().__init__(master, **kwargs)
+        self.title("Auto-Detect Results")
+        self.geometry("640x420")
+        self.on_select = on_select
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        customtkinter.CTkLabel(self, text=f"{len(candidates)} candidate recipe{'s' if len(candidates) != 1 else ''}",
+                               font=customtkinter.CTkFont(size=18, weight="bold")).grid(row=0, column=0, padx=20,
+                                                                                        pady=(10, 5), sticky="w")
+
+        results_frame = customtkinter.CTkScrollableFrame(self)
+        results_frame.grid(row=1, column=0, padx=10, pady=(5, 10), sticky="nsew")
+        results_frame.grid_columnconfigure(0, weight=1)
+
+        for rank, candidate in enumerate(candidates, start=1):
+            row = customtkinter.CTkFrame(results_frame)
+            row.grid(row=rank, column=0, padx=5, pady=4, sticky="ew")
+            row.grid_columnconfigure(0, weight=1)
+
+            customtkinter.CTkLabel(row, text=f"#{rank}  {candidate.describe()}", anchor="w", justify="left",
+                                   font=customtkinter.CTkFont(weight="bold"), wraplength=480).grid(
+                row=0, column=0, padx=10, pady=(5, 0), sticky="ew")
+            customtkinter.CTkLabel(row, text=f"Score {candidate.score:.2f} · {candidate.preview()}", anchor="w",
+                                   justify="left", text_color="gray60", wraplength=480).grid(
+                row=1, column=0, padx=10, pady=(0, 5), sticky="ew")
+            customtkinter.CTkButton(row, text="Load", width=70,
+                                    command=lambda c=candidate: self.select(c)).grid(row=0, column=1, rowspan=2,
+                                                                                     padx=10, pady=5)
+
+        self.after(100, self.lift)
+
+    def select(self, candidate):
+        self.on_select(candidate)
+        self.destroy()
@@ -2,10 +2,20 @@
 
 import customtkinter
 import pyperclip
-import json
 import threading
 import queue
 from tkinter import filedialog
+from engine.recipe import RecipeStep, save_recipe_file
+from engine.cancellation import CancellationToken, OperationCancelled
+from engine.optimizer import optimize_recipe
+from engine.recipe_engine import RecipeEngine
+from engine.result_cache import ResultCache
+from engine.step_cache import StepCache
+from gui.explain_window import ExplainWindow
+from gui.output_view import OutputView
+from engine.streaming import buffered_operations, stream_file
+from operations.asymmetric_ciphers import RSA_KEY_SIZES
+from operations.ciphers import OUTPUT_FORMATS
 
 
 class BaseFrame(customtkinter.CTkFrame):
@@ -19,6 +29,10 @@ class BaseFrame(customtkinter.CTkFrame):
         self.current_step_index = 0
         self.recipe_placeholder = None
         self.result_queue = queue.Queue()
+        self.cancel_token = None
+        self.engine = RecipeEngine(self.operation_mode)
+        self.step_cache = StepCache(self.engine)
+        self.result_cache = ResultCache()
 
         # --- Layout Configuration ---
         self.grid_columnconfigure(0, weight=2, minsize=200)
@@ -32,16 +46,26 @@ class BaseFrame(customtkinter.CTkFrame):
         self.create_recipe_panel()
         self.create_io_panel()
         self.update_recipe_placeholder()
+        self.bind("<<WorkerMessage>>", self.check_queue)
 
     # --- Threading and Processing Logic (Common to both frames) ---
 
     def set_processing_state(self, is_processing: bool):
-        """Disables/Enables buttons during processing."""
+        """Disables/Enables buttons during processing. While busy, the bake button cancels."""
         state = "disabled" if is_processing else "normal"
-        self.bake_button.configure(state=state)
         self.step_button.configure(state=state)
         if is_processing:
+            self.bake_button.configure(text="⏹ Cancel", command=self.cancel_processing)
             self.status_bar.configure(text="Processing... Please wait.", text_color="orange")
+        else:
+            self.bake_button.configure(text="🏭 Bake Recipe!", command=self.bake_recipe)
+            self.cancel_token = None
+
+    def cancel_processing(self):
+        """Asks the running worker to stop at its next check point."""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.status_bar.configure(text="Cancelling...", text_color="orange")
 
     def reset_step_state(self, event=None):
         self.current_step_index = 0
@@ -50,109 +74,173 @@ class BaseFrame(customtkinter.CTkFrame):
                 widget.configure(border_width=0)
         self.status_bar.configure(text="Ready", text_color="gray70")
 
-    def process_step(self):
-        """Starts step-by-step processing in a background thread."""
+    def start_worker(self, target, *args):
+        """Runs `target(token, *args)` in a background thread with a fresh cancellation token."""
         self.set_processing_state(True)
-        thread = threading.Thread(target=self._worker_process_step)
+        self.cancel_token = CancellationToken()
+        thread = threading.Thread(target=target, args=(self.cancel_token, *args))
         thread.daemon = True
         thread.start()
-        self.after(100, self.check_queue)
+
+    def post_result(self, message):
+        """Hands a message to the Tk thread (called from workers); wakes check_queue via a virtual event."""
+        self.result_queue.put(message)
+        self.event_generate("<<WorkerMessage>>", when="tail")
+
+    def process_step(self):
+        """Starts step-by-step processing in a background thread."""
+        recipe = self.get_recipe()
+        input_data = self.input_textbox.get("1.0", "end-1c")
+        self.start_worker(self._worker_process_step, recipe, input_data)
 
     def bake_recipe(self):
         """Starts full recipe processing in a background thread."""
-        self.set_processing_state(True)
-        thread = threading.Thread(target=self._worker_bake_recipe)
-        thread.daemon = True
-        thread.start()
-        self.after(100, self.check_queue)
+        self.reset_step_state()
+        recipe = self.get_recipe()
+        input_data = self.input_textbox.get("1.0", "end-1c")
+        self.start_worker(self._worker_bake_recipe, recipe, input_data)
+
+    def stream_file_through_recipe(self):
+        """Runs the recipe over a file in chunks, writing the result straight to another file."""
+        recipe = self.get_recipe()
+        if not recipe:
+            self.app.show_toast("Recipe Error", "Please add at least one operation.", toast_type="error")
+            return
+        input_path = filedialog.askopenfilename(title="Stream File Through Recipe",
+                                                filetypes=[("All files", "*.*"), ("Text files", "*.txt")])
+        if not input_path: return
+        output_path = filedialog.asksaveasfilename(title="Save Streamed Output As", defaultextension=".txt",
+                                                   filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not output_path: return
+        buffered = buffered_operations(self.engine, recipe)
+        if buffered:
+            self.app.show_toast("Not Fully Streamed",
+                                f"{', '.join(dict.fromkeys(buffered))} cannot stream; the whole file will be "
+                                f"loaded into memory.", toast_type="warning")
+        self.reset_step_state()
+        self.start_worker(self._worker_stream_file, recipe, input_path, output_path)
 
-    def _worker_process_step(self):
-        """Worker function for step processing (runs in background)."""
-        recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children() if
-                        isinstance(child, customtkinter.CTkFrame)]
-        if not recipe_steps:
-            self.result_queue.put(("error", ("Recipe Error", "Please add an operation.")))
+    def _worker_stream_file(self, token, recipe, input_path, output_path):
+        """Worker function for streaming a file (runs in background)."""
+        def progress(done, total):
+            percent = 100 * done // total if total else 100
+            self.post_result(("progress", f"Streaming... {percent}% ({done // 1024} / {total // 1024} KB)"))
+
+        try:
+            success, message = stream_file(self.engine, recipe, input_path, output_path, token=token,
+                                           progress=progress)
+        except OperationCancelled:
+            self.post_result(("cancelled", "Streaming cancelled. Partial output removed."))
             return
+        except Exception as e:
+            self.post_result(("error", ("Processing Failed", f"Streaming failed: {e}")))
+            return
+        if not success:
+            self.post_result(("error", ("Processing Failed", message)))
+            return
+        self.post_result(("stream_success", message))
 
-        if self.current_step_index >= len(recipe_steps):
-            self.result_queue.put(("reset", "End of recipe reached. Resetting."))
+    def _worker_process_step(self, token, recipe, input_data):
+        """Worker function for step processing (runs in background)."""
+        if not recipe:
+            self.post_result(("error", ("Recipe Error", "Please add an operation.")))
             return
 
-        current_data = self.input_textbox.get("1.0", "end-1c")
+        if self.current_step_index >= len(recipe):
+            self.post_result(("reset", "End of recipe reached. Resetting."))
+            return
 
-        for i in range(self.current_step_index + 1):
-            step_frame = recipe_steps[i]
-            operation_name = step_frame.op_name
-            success, current_data = self.execute_operation(operation_name, current_data, step_frame)
-            if not success:
-                self.result_queue.put(
-                    ("error", ("Processing Failed", f"Step '{operation_name}' failed: {current_data}")))
-                return
+        try:
+            success, current_data = self.step_cache.run_to(recipe, input_data, self.current_step_index, token)
+        except OperationCancelled:
+            self.post_result(("cancelled", "Step cancelled."))
+            return
+        except Exception as e:
+            self.post_result(("error", ("Processing Failed", f"Step failed: {e}")))
+            return
+        if not success:
+            self.post_result(("error", ("Processing Failed", current_data)))
+            return
 
-        self.result_queue.put(("step_success", (current_data, self.current_step_index)))
+        self.post_result(("step_success", (current_data, self.current_step_index)))
 
-    def _worker_bake_recipe(self):
+    def _worker_bake_recipe(self, token, recipe, input_data):
         """Worker function for baking (runs in background)."""
-        self.reset_step_state()
-        current_data = self.input_textbox.get("1.0", "end-1c")
-        recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children() if
-                        isinstance(child, customtkinter.CTkFrame)]
+        if not input_data:
+            self.post_result(("error", ("Input Error", "The input field is empty.")))
+            return
+        if not recipe:
+            self.post_result(("error", ("Recipe Error", "Please add at least one operation.")))
+            return
+
+        def progress(index, total, step):
+            self.post_result(("progress", f"Step {index + 1}/{total}: {step.operation}..."))
 
-        if not current_data:
-            self.result_queue.put(("error", ("Input Error", "The input field is empty.")))
+        try:
+            optimized = optimize_recipe(self.engine, recipe)
+            cached = self.result_cache.lookup(self.engine, optimized.steps, input_data)
+            if cached is not None:
+                self.post_result(("bake_success", (cached, optimized.passes_saved, True)))
+                return
+            success, current_data = self.engine.bake(optimized.steps, input_data, token=token, progress=progress)
+        except OperationCancelled:
+            self.post_result(("cancelled", "Bake cancelled."))
+            return
+        except Exception as e:
+            self.post_result(("error", ("Processing Failed", f"Bake failed: {e}")))
             return
-        if not recipe_steps:
-            self.result_queue.put(("error", ("Recipe Error", "Please add at least one operation.")))
+        if not success:
+            self.post_result(("error", ("Processing Failed", current_data)))
             return
 
-        for step_frame in recipe_steps:
-            operation_name = step_frame.op_name
-            success, current_data = self.execute_operation(operation_name, current_data, step_frame)
-            if not success:
-                self.result_queue.put(
-                    ("error", ("Processing Failed", f"Step '{operation_name}' failed: {current_data}")))
+        self.result_cache.store(self.engine, optimized.steps, input_data, current_data)
+        self.post_result(("bake_success", (current_data, optimized.passes_saved, False)))
+
+    def check_queue(self, event=None):
+        """Handles every pending message from the background thread to update the UI."""
+        while True:
+            try:
+                msg_type, data = self.result_queue.get_nowait()
+            except queue.Empty:
                 return
+            self.handle_worker_message(msg_type, data)
 
-        self.result_queue.put(("bake_success", current_data))
+    def handle_worker_message(self, msg_type, data):
+        if msg_type == "progress":
+            self.status_bar.configure(text=data, text_color="orange")
+            return
 
-    def check_queue(self):
-        """Checks queue for results from the background thread to update the UI."""
-        try:
-            message = self.result_queue.get_nowait()
-            msg_type, data = message
-
-            if msg_type == "bake_success":
-                self.output_textbox.configure(state="normal")
-                self.output_textbox.delete("1.0", "end")
-                self.output_textbox.insert("1.0", data)
-                self.output_textbox.configure(state="disabled")
-                self.status_bar.configure(text="Recipe baked successfully!", text_color="gray70")
-            elif msg_type == "step_success":
-                result_data, step_index = data
-                self.output_textbox.configure(state="normal")
-                self.output_textbox.delete("1.0", "end")
-                self.output_textbox.insert("1.0", result_data)
-                self.output_textbox.configure(state="disabled")
-
-                recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children() if
-                                isinstance(child, customtkinter.CTkFrame)]
-                for widget in recipe_steps: widget.configure(border_width=0)
-                current_step_frame = recipe_steps[step_index]
-                current_step_frame.configure(border_width=2, border_color="#3498DB")
-                self.status_bar.configure(text=f"Executed step {step_index + 1}: {current_step_frame.op_name}",
-                                          text_color="gray70")
-                self.current_step_index += 1
-            elif msg_type == "reset":
-                self.status_bar.configure(text=data, text_color="gray70")
-                self.reset_step_state()
-            elif msg_type == "error":
-                title, msg = data
-                self.app.show_toast(title, msg, toast_type="error")
-                self.reset_step_state()
-
-            self.set_processing_state(False)
-        except queue.Empty:
-            self.after(100, self.check_queue)
+        if msg_type == "bake_success":
+            result_data, passes_saved, from_cache = data
+            self.output_view.set_data(result_data)
+            status = "Recipe baked successfully!"
+            if from_cache:
+                status += " (from cache)"
+            if passes_saved:
+                status += f" (optimizer skipped {passes_saved} redundant step{'s' if passes_saved != 1 else ''})"
+            self.status_bar.configure(text=status, text_color="gray70")
+        elif msg_type == "step_success":
+            result_data, step_index = data
+            self.output_view.set_data(result_data)
+
+            recipe_steps = self.get_recipe_step_frames()
+            for widget in recipe_steps: widget.configure(border_width=0)
+            current_step_frame = recipe_steps[step_index]
+            current_step_frame.configure(border_width=2, border_color="#3498DB")
+            self.status_bar.configure(text=f"Executed step {step_index + 1}: {current_step_frame.op_name}",
+                                      text_color="gray70")
+            self.current_step_index += 1
+        elif msg_type in ("stream_success", "cancelled"):
+            self.status_bar.configure(text=data, text_color="gray70")
+        elif msg_type == "reset":
+            self.status_bar.configure(text=data, text_color="gray70")
+            self.reset_step_state()
+        elif msg_type == "error":
+            title, msg = data
+            self.app.show_toast(title, msg, toast_type="error")
+            self.reset_step_state()
+
+        self.set_processing_state(False)
 
     # --- Recipe and UI Management (Common to both frames) ---
 
@@ -185,7 +273,25 @@ class BaseFrame(customtkinter.CTkFrame):
             entry.insert(0, str(shift_val))
             entry.pack(side="left", fill="x", expand=True)
             step_frame.param_entry = entry
-        elif "RSA" in operation_name:
+        elif "Key Gen" in operation_name:
+            operation = self.engine.operations.get(operation_name)
+            if operation is not None and "key_size" in operation.params:
+                size_menu = customtkinter.CTkOptionMenu(param_container, values=[str(size) for size in RSA_KEY_SIZES],
+                                                        width=90)
+                size_menu.set(str(args.get("key_size") or 2048))
+                size_menu.pack(side="left", padx=(5, 0))
+                step_frame.param_entry = size_menu
+        elif "Password" in operation_name:
+            entry = customtkinter.CTkEntry(param_container, placeholder_text="Enter Password...", show="*", width=150)
+            entry.insert(0, args.get("password", ""))
+            entry.pack(side="left", fill="x", expand=True)
+            step_frame.param_entry = entry
+        elif operation_name == "Substitution Cipher":
+            entry = customtkinter.CTkEntry(param_container, placeholder_text="52 letters: a-z then A-Z", width=150)
+            entry.insert(0, args.get("alphabet", ""))
+            entry.pack(side="left", fill="x", expand=True)
+            step_frame.param_entry = entry
+        elif any(name in operation_name for name in ["RSA", "Ed25519", "X25519"]):
             key_val = args.get("key", "")
             textbox = customtkinter.CTkTextbox(param_container, height=120)
             textbox.insert("1.0", key_val)
@@ -197,6 +303,12 @@ class BaseFrame(customtkinter.CTkFrame):
             entry.insert(0, key_val)
             entry.pack(side="left", fill="x", expand=True)
             step_frame.param_entry = entry
+            operation = self.engine.operations.get(operation_name)
+            if operation is not None and "output" in operation.params:
+                output_menu = customtkinter.CTkOptionMenu(param_container, values=list(OUTPUT_FORMATS), width=90)
+                output_menu.set(args.get("output") or "hex")
+                output_menu.pack(side="left", padx=(5, 0))
+                step_frame.output_menu = output_menu
         elif "AES" in operation_name:
             key = args.get("key", "")
             entry = customtkinter.CTkEntry(param_container, placeholder_text="Enter Key...")
@@ -213,33 +325,49 @@ class BaseFrame(customtkinter.CTkFrame):
         self.reset_step_state()
         self.update_recipe_placeholder()
 
+    def get_recipe_step_frames(self):
+        return [child for child in self.recipe_scrollable_frame.winfo_children() if
+                isinstance(child, customtkinter.CTkFrame)]
+
+    def get_recipe(self) -> list[RecipeStep]:
+        """Reads the recipe out of the step widgets as plain data (must run on the Tk thread)."""
+        recipe = []
+        for step_frame in self.get_recipe_step_frames():
+            args = {}
+            operation = self.engine.operations.get(step_frame.op_name)
+            if hasattr(step_frame, 'param_entry') and operation is not None and operation.params:
+                if isinstance(step_frame.param_entry, customtkinter.CTkTextbox):
+                    param_value = step_frame.param_entry.get("1.0", "end-1c")
+                else:
+                    param_value = step_frame.param_entry.get()
+                args[operation.params[0]] = param_value
+            if hasattr(step_frame, 'output_menu'):
+                args["output"] = step_frame.output_menu.get()
+            recipe.append(RecipeStep(step_frame.op_name, args))
+        return recipe
+
     def save_recipe(self):
-        recipe_steps = [child for child in self.recipe_scrollable_frame.winfo_children() if
-                        isinstance(child, customtkinter.CTkFrame)]
-        if not recipe_steps:
+        recipe = self.get_recipe()
+        if not recipe:
             self.app.show_toast("Warning", "Recipe is empty, nothing to save.", toast_type="warning")
             return
-        recipe_data = []
-        for step_frame in recipe_steps:
-            operation_name = step_frame.op_name
-            args = {}
-            if hasattr(step_frame, 'param_entry'):
-                param_value = step_frame.param_entry.get()
-                if "Caesar" in operation_name:
-                    args["shift"] = param_value
-                elif "AES" in operation_name:
-                    args["key"] = param_value
-            recipe_data.append({"operation": operation_name, "args": args})
         filepath = filedialog.asksaveasfilename(title="Save Recipe As", defaultextension=".json",
                                                 filetypes=[("JSON files", "*.json")])
         if not filepath: return
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(recipe_data, f, indent=4)
+            save_recipe_file(recipe, filepath)
             self.status_bar.configure(text=f"Recipe saved!", text_color="gray70")
         except Exception as e:
             self.app.show_toast("File Error", f"Failed to save recipe: {e}", toast_type="error")
 
+    def explain_recipe(self):
+        """Shows what the optimizer would run for the current recipe, and why."""
+        recipe = self.get_recipe()
+        if not recipe:
+            self.app.show_toast("Warning", "Recipe is empty, nothing to explain.", toast_type="warning")
+            return
+        ExplainWindow(self, optimize_recipe(self.engine, recipe))
+
     def update_recipe_placeholder(self):
         step_frames_exist = any(
             isinstance(child, customtkinter.CTkFrame) for child in self.recipe_scrollable_frame.winfo_children())
@@ -267,6 +395,8 @@ class BaseFrame(customtkinter.CTkFrame):
                                 command=self.load_recipe).pack(side="right", padx=(5, 0))
         customtkinter.CTkButton(recipe_header, text="💾 Save", width=70, command=self.save_recipe).pack(side="right",
                                                                                                        padx=(5, 0))
+        customtkinter.CTkButton(recipe_header, text="🔍 Explain", width=80, command=self.explain_recipe).pack(
+            side="right", padx=(5, 0))
         customtkinter.CTkButton(recipe_header, text="Clear All", width=80, command=self.clear_recipe, fg_color="gray40",
                                 hover_color="gray30").pack(side="right")
         self.recipe_scrollable_frame = customtkinter.CTkScrollableFrame(recipe_frame)
@@ -295,6 +425,8 @@ class BaseFrame(customtkinter.CTkFrame):
                                 hover_color="#C2590E").pack(side="right", padx=(5, 0))
         customtkinter.CTkButton(input_controls, text="📂 Open", width=80, command=self.open_from_file).pack(side="right",
                                                                                                            padx=(5, 0))
+        customtkinter.CTkButton(input_controls, text="⚡ Stream", width=80,
+                                command=self.stream_file_through_recipe).pack(side="right", padx=(5, 0))
         customtkinter.CTkButton(input_controls, text="📋 Paste", width=80, command=self.paste_to_input).pack(
             side="right", padx=(5, 0))
         self.input_textbox = customtkinter.CTkTextbox(io_frame)
@@ -310,13 +442,12 @@ class BaseFrame(customtkinter.CTkFrame):
                                                                                                           padx=(5, 0))
         customtkinter.CTkButton(output_controls, text="📝 Copy", width=80, command=self.copy_output).pack(side="right",
                                                                                                          padx=(5, 0))
-        self.output_textbox = customtkinter.CTkTextbox(io_frame, state="disabled")
-        self.output_textbox.grid(row=3, column=0, padx=10, pady=(0, 0), sticky="nsew")
+        self.output_view = OutputView(io_frame)
+        self.output_view.grid(row=3, column=0, padx=10, pady=(0, 0), sticky="nsew")
 
     def copy_output(self):
-        content = self.output_textbox.get("1.0", "end-1c")
-        if content:
-            pyperclip.copy(content)
+        if not self.output_view.is_empty():
+            pyperclip.copy(self.output_view.text)
             self.status_bar.configure(text="Output copied to clipboard.", text_color="gray70")
         else:
             self.app.show_toast("Warning", "Output is empty.", toast_type="warning")
@@ -334,14 +465,13 @@ class BaseFrame(customtkinter.CTkFrame):
             self.app.show_toast("File Error", f"Failed to read file: {e}", toast_type="error")
 
     def save_to_file(self):
-        content = self.output_textbox.get("1.0", "end-1c")
-        if not content: self.app.show_toast("Warning", "Output is empty.", toast_type="warning"); return
+        if self.output_view.is_empty(): self.app.show_toast("Warning", "Output is empty.", toast_type="warning"); return
         filepath = filedialog.asksaveasfilename(title="Save Output As", defaultextension=".txt",
                                                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
         if not filepath: return
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with open(filepath, 'wb') as f:
+                f.write(self.output_view.data.raw)
         except Exception as e:
             self.app.show_toast("Error", f"Failed to save file: {e}", toast_type="error")
 
@@ -358,14 +488,9 @@ class BaseFrame(customtkinter.CTkFrame):
         self.reset_step_state()
 
     def clear_output(self):
-        self.output_textbox.configure(state="normal");
-        self.output_textbox.delete("1.0", "end");
-        self.output_textbox.configure(state="disabled")
+        self.output_view.clear()
 
     # --- Methods to be implemented by child classes ---
-    def execute_operation(self, operation_name, input_data, step_frame):
-        raise NotImplementedError("This method must be implemented by a subclass")
-
     def create_operations_sidebar(self):
         raise NotImplementedError("This method must be implemented by a subclass")
 
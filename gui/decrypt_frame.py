@@ -1,14 +1,10 @@
 import customtkinter
-import json
 from tkinter import filedialog
 from gui.base_frame import BaseFrame
-from operations.encoders import from_base64
-from operations.ciphers import caesar_cipher , atbash_cipher
-from operations.hex import from_hex
-from operations.text_converters import from_binary, from_morse
-from operations.ciphers import aes_decrypt, des_decrypt, triple_des_decrypt, blowfish_decrypt
-from operations.ciphers import rot13_cipher, vigenere_cipher
-from operations.asymmetric_ciphers import rsa_decrypt
+from gui.auto_detect_window import AutoDetectWindow
+from engine.auto_detect import auto_detect
+from engine.cancellation import OperationCancelled
+from engine.recipe import INVERSE_OPERATIONS, load_recipe_file, skipped_inverse_message
 
 
 class DecryptFrame(BaseFrame):
@@ -17,91 +13,13 @@ class DecryptFrame(BaseFrame):
         self.recipe_title = "Decryption Recipe"
         self.placeholder_text = "Click an operation or load & invert a recipe..."
         self.load_button_text = "📂 Load & Invert"
+        self.operation_mode = "decrypt"
         self.load_button_width = 110
 
-        self.inverse_operations = {
-            "To Base64": "From Base64", "From Base64": "To Base64",
-            "To Hex": "From Hex", "From Hex": "To Hex",
-            "To Binary": "From Binary", "From Binary": "To Binary",
-            "Morse Code": "From Morse", "From Morse": "Morse Code",
-            "Caesar Encrypt": "Caesar Decrypt", "Caesar Decrypt": "Caesar Encrypt",
-            "Atbash Cipher": "Atbash Cipher", "ROT13 Cipher": "ROT13 Cipher",
-            "Vigenère Cipher": "Vigenère Cipher",
-            "AES Encrypt": "AES Decrypt", "AES Decrypt": "AES Encrypt",
-            "RSA Encrypt": "RSA Decrypt", "RSA Decrypt": "RSA Encrypt"
-        }
+        self.inverse_operations = INVERSE_OPERATIONS
 
         super().__init__(master, app, status_bar, **kwargs)
 
-    def execute_operation(self, operation_name, input_data, step_frame):
-        if operation_name == "From Base64":
-            return from_base64(input_data)
-        elif operation_name == "From Hex":
-            return from_hex(input_data)
-        elif operation_name == "From Binary":
-            return from_binary(input_data)
-        elif operation_name == "From Morse Code":
-            return from_morse(input_data)
-        elif operation_name == "Caesar Decrypt":
-            try:
-                shift = int(step_frame.param_entry.get())
-                if not 1 <= shift <= 25:
-                    return False, "Shift must be between 1 and 25."
-                return caesar_cipher(input_data, shift, decrypt=True)
-            except (ValueError, TypeError):
-                return False, "Invalid shift value. Must be an integer."
-            except AttributeError:
-                return False, "Could not find shift parameter."
-        elif operation_name == "Atbash Cipher":
-            return atbash_cipher(input_data)
-        elif operation_name == "ROT13 Cipher":
-            return rot13_cipher(input_data)
-        elif operation_name == "Vigenère Cipher":
-            try:
-                key = step_frame.param_entry.get()
-                if not key:
-                    return False, "Vigenère key cannot be empty."
-                return vigenere_cipher(input_data, key, decrypt=True)
-            except AttributeError:
-                return False, "Could not find key parameter."
-            
-        elif operation_name == "AES Decrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return aes_decrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "DES Decrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return des_decrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "Triple DES Decrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return triple_des_decrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "Blowfish Decrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return blowfish_decrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "RSA Decrypt":
-            try:
-                private_key = step_frame.param_entry.get("1.0", "end-1c")
-                if not private_key:
-                    return False, "RSA private key cannot be empty."
-                return rsa_decrypt(input_data, private_key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        else:
-            return False, f"Unknown operation: {operation_name}"
-        
-
-
     def create_operations_sidebar(self):
         sidebar_frame = customtkinter.CTkFrame(self)
         sidebar_frame.grid(row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
@@ -166,6 +84,12 @@ class DecryptFrame(BaseFrame):
                                 command=lambda: self.add_recipe_step("ROT13 Cipher")).grid(row=current_row, column=0,
                                                                                            sticky="ew", padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Substitution Cipher", anchor="w",
+                                command=lambda: self.add_recipe_step("Substitution Cipher")).grid(row=current_row,
+                                                                                                  column=0,
+                                                                                                  sticky="ew", padx=10,
+                                                                                                  pady=2)
+        current_row += 1
         customtkinter.CTkButton(scrollable_frame, text="Vigenère Cipher", anchor="w",
                                 command=lambda: self.add_recipe_step("Vigenère Cipher")).grid(row=current_row, column=0,
                                                                                               sticky="ew", padx=10,
@@ -196,6 +120,16 @@ class DecryptFrame(BaseFrame):
                                                                                                column=0, sticky="ew",
                                                                                                padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="AES-GCM Decrypt", anchor="w",
+                                command=lambda: self.add_recipe_step("AES-GCM Decrypt")).grid(row=current_row,
+                                                                                              column=0, sticky="ew",
+                                                                                              padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Password Decrypt", anchor="w",
+                                command=lambda: self.add_recipe_step("Password Decrypt")).grid(row=current_row,
+                                                                                               column=0, sticky="ew",
+                                                                                               padx=10, pady=2)
+        current_row += 1
         current_row = add_separator(current_row)
 
         # --- Section: Asymmetric Ciphers (Correctly Added) ---
@@ -207,37 +141,81 @@ class DecryptFrame(BaseFrame):
                                 command=lambda: self.add_recipe_step("RSA Decrypt")).grid(row=current_row, column=0,
                                                                                           sticky="ew", padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Ed25519 Verify", anchor="w",
+                                command=lambda: self.add_recipe_step("Ed25519 Verify")).grid(row=current_row,
+                                                                                             column=0, sticky="ew",
+                                                                                             padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="X25519 Open", anchor="w",
+                                command=lambda: self.add_recipe_step("X25519 Open")).grid(row=current_row, column=0,
+                                                                                          sticky="ew", padx=10, pady=2)
+        current_row += 1
 
 
     def load_recipe(self):
         filepath = filedialog.askopenfilename(title="Load and Invert Recipe", filetypes=[("JSON files", "*.json")])
         if not filepath: return
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                recipe_data = json.load(f)
+            recipe = load_recipe_file(filepath)
             self.clear_recipe()
 
-            for step in reversed(recipe_data):
-                original_op_name = step.get("operation")
+            for step in reversed(recipe):
+                original_op_name = step.operation
                 inverted_op_name = self.inverse_operations.get(original_op_name, "Unknown")
 
                 if inverted_op_name == "Unknown":
-                    self.app.show_toast("Warning", f"Could not find an inverse for '{original_op_name}'. Skipping.",
-                                        "warning")
+                    self.app.show_toast("Warning", skipped_inverse_message(original_op_name), "warning")
                     continue
 
-                args = step.get("args", {})
-                self.add_recipe_step(inverted_op_name, args=args)
+                self.add_recipe_step(inverted_op_name, args=step.args)
 
             self.status_bar.configure(text=f"Recipe loaded and inverted!", text_color="gray70")
         except Exception as e:
             self.app.show_toast("File Error", f"Failed to load and invert recipe: {e}", toast_type="error")
 
-    # --- NEW: Placeholder function for the Auto-Detect button ---
-    def auto_detect_placeholder(self):
-        """Shows a toast notification for the coming soon feature."""
-        self.app.show_toast("Coming Soon!", "The Auto-Detect feature is currently under development.",
-                            toast_type="info")
+    # --- Auto-Detect ---
+    def auto_detect(self):
+        """Searches for a decoding recipe for the input in a background thread."""
+        input_data = self.input_textbox.get("1.0", "end-1c")
+        if not input_data:
+            self.app.show_toast("Input Error", "The input field is empty.", toast_type="error")
+            return
+        self.reset_step_state()
+        self.start_worker(self._worker_auto_detect, input_data)
+
+    def _worker_auto_detect(self, token, input_data):
+        """Worker function for auto-detect (runs in background)."""
+        self.post_result(("progress", "Auto-detecting..."))
+        try:
+            candidates = auto_detect(self.engine, input_data, token=token)
+        except OperationCancelled:
+            self.post_result(("cancelled", "Auto-detect cancelled."))
+            return
+        except Exception as e:
+            self.post_result(("error", ("Auto-Detect Failed", f"Auto-detect failed: {e}")))
+            return
+        self.post_result(("auto_detect_success", candidates))
+
+    def handle_worker_message(self, msg_type, data):
+        if msg_type != "auto_detect_success":
+            super().handle_worker_message(msg_type, data)
+            return
+        if data:
+            AutoDetectWindow(self, data, self.load_detected_recipe)
+            self.status_bar.configure(text=f"Auto-detect found {len(data)} candidate recipe(s).",
+                                      text_color="gray70")
+        else:
+            self.app.show_toast("Auto-Detect", "No decoding made the input more readable.", toast_type="info")
+            self.status_bar.configure(text="Ready", text_color="gray70")
+        self.set_processing_state(False)
+
+    def load_detected_recipe(self, candidate):
+        """Replaces the recipe with an auto-detect candidate and shows its output."""
+        self.clear_recipe()
+        for step in candidate.steps:
+            self.add_recipe_step(step.operation, args=step.args)
+        self.output_view.set_data(candidate.data)
+        self.status_bar.configure(text=f"Loaded recipe: {candidate.describe()}", text_color="gray70")
 
     def create_recipe_panel(self):
         # --- MODIFIED: This panel now includes the Auto-Detect button again ---
@@ -254,12 +232,14 @@ class DecryptFrame(BaseFrame):
                                 command=self.load_recipe).pack(side="right", padx=(5, 0))
         customtkinter.CTkButton(recipe_header, text="💾 Save", width=70, command=self.save_recipe).pack(side="right",
                                                                                                        padx=(5, 0))
+        customtkinter.CTkButton(recipe_header, text="🔍 Explain", width=80, command=self.explain_recipe).pack(
+            side="right", padx=(5, 0))
         customtkinter.CTkButton(recipe_header, text="Clear All", width=80, command=self.clear_recipe, fg_color="gray40",
                                 hover_color="gray30").pack(side="right")
 
         # The Auto-Detect button is added back here
         auto_detect_button = customtkinter.CTkButton(recipe_frame, text="Auto-Detect Magic ✨", height=40,
-                                                     command=self.auto_detect_placeholder)
+                                                     command=self.auto_detect)
         auto_detect_button.grid(row=1, column=0, padx=10, pady=(5, 10), sticky="ew")
 
         self.recipe_scrollable_frame = customtkinter.CTkScrollableFrame(recipe_frame)
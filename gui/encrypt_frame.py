@@ -1,15 +1,9 @@
 # File: gui/encrypt_frame.py
 
 import customtkinter
-import json
 from tkinter import filedialog
 from gui.base_frame import BaseFrame
-from operations.encoders import to_base64
-from operations.ciphers import caesar_cipher, atbash_cipher, rot13_cipher, vigenere_cipher, aes_encrypt, des_encrypt, triple_des_encrypt, blowfish_encrypt
-from operations.hex import to_hex
-from operations.text_converters import to_binary, to_morse
-from operations.asymmetric_ciphers import rsa_encrypt
-from operations.hashing_core import hash_md5, hash_sha1, hash_sha256, hash_sha512
+from engine.recipe import load_recipe_file
 
 
 class EncryptFrame(BaseFrame):
@@ -18,84 +12,11 @@ class EncryptFrame(BaseFrame):
         self.recipe_title = "Encryption Recipe"
         self.placeholder_text = "Click an operation to begin..."
         self.load_button_text = "📂 Load"
+        self.operation_mode = "encrypt"
         self.load_button_width = 70
 
         super().__init__(master, app, status_bar, **kwargs)
 
-    def execute_operation(self, operation_name, input_data, step_frame):
-        if operation_name == "To Base64":
-            return to_base64(input_data)
-        elif operation_name == "To Hex":
-            return to_hex(input_data)
-        elif operation_name == "To Binary":
-            return to_binary(input_data)
-        elif operation_name == "Morse Code":
-            return to_morse(input_data)
-        elif operation_name == "Caesar Encrypt":
-            try:
-                shift = int(step_frame.param_entry.get())
-                if not 1 <= shift <= 25:
-                    return False, "Shift must be between 1 and 25."
-                return caesar_cipher(input_data, shift, decrypt=False)
-            except (ValueError, TypeError):
-                return False, "Invalid shift value. Must be an integer."
-            except AttributeError:
-                return False, "Could not find shift parameter."
-        elif operation_name == "Atbash Cipher":
-            return atbash_cipher(input_data)
-        elif operation_name == "ROT13 Cipher":
-            return rot13_cipher(input_data)
-        elif operation_name == "Vigenère Cipher":
-            try:
-                key = step_frame.param_entry.get()
-                if not key:
-                    return False, "Vigenère key cannot be empty."
-                return vigenere_cipher(input_data, key, decrypt=False)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "AES Encrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return aes_encrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "DES Encrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return des_encrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "Triple DES Encrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return triple_des_encrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "Blowfish Encrypt":
-            try:
-                key = step_frame.param_entry.get()
-                return blowfish_encrypt(input_data, key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "RSA Encrypt":
-            try:
-                public_key = step_frame.param_entry.get("1.0", "end-1c")
-                if not public_key:
-                    return False, "RSA public key cannot be empty."
-                return rsa_encrypt(input_data, public_key)
-            except AttributeError:
-                return False, "Could not find key parameter."
-        elif operation_name == "MD5":
-            return hash_md5(input_data)
-        elif operation_name == "SHA-1":
-            return hash_sha1(input_data)
-        elif operation_name == "SHA-256":
-            return hash_sha256(input_data)
-        elif operation_name == "SHA-512":
-            return hash_sha512(input_data)
-        else:
-            return False, f"Unknown operation: {operation_name}"
-
     def create_operations_sidebar(self):
         sidebar_frame = customtkinter.CTkFrame(self)
         sidebar_frame.grid(row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
@@ -161,6 +82,12 @@ class EncryptFrame(BaseFrame):
                                 command=lambda: self.add_recipe_step("ROT13 Cipher")).grid(row=current_row, column=0,
                                                                                            sticky="ew", padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Substitution Cipher", anchor="w",
+                                command=lambda: self.add_recipe_step("Substitution Cipher")).grid(row=current_row,
+                                                                                                  column=0,
+                                                                                                  sticky="ew", padx=10,
+                                                                                                  pady=2)
+        current_row += 1
         customtkinter.CTkButton(scrollable_frame, text="Vigenère Cipher", anchor="w",
                                 command=lambda: self.add_recipe_step("Vigenère Cipher")).grid(row=current_row, column=0,
                                                                                               sticky="ew", padx=10,
@@ -191,6 +118,16 @@ class EncryptFrame(BaseFrame):
                                                                                                column=0, sticky="ew",
                                                                                                padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="AES-GCM Encrypt", anchor="w",
+                                command=lambda: self.add_recipe_step("AES-GCM Encrypt")).grid(row=current_row,
+                                                                                              column=0, sticky="ew",
+                                                                                              padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Password Encrypt", anchor="w",
+                                command=lambda: self.add_recipe_step("Password Encrypt")).grid(row=current_row,
+                                                                                               column=0, sticky="ew",
+                                                                                               padx=10, pady=2)
+        current_row += 1
         current_row = add_separator(current_row)
 
         # --- Section: Asymmetric Ciphers ---
@@ -202,6 +139,34 @@ class EncryptFrame(BaseFrame):
                                 command=lambda: self.add_recipe_step("RSA Encrypt")).grid(row=current_row, column=0,
                                                                                           sticky="ew", padx=10, pady=2)
         current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="RSA Envelope Encrypt", anchor="w",
+                                command=lambda: self.add_recipe_step("RSA Envelope Encrypt")).grid(row=current_row,
+                                                                                                   column=0,
+                                                                                                   sticky="ew",
+                                                                                                   padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="RSA Key Gen", anchor="w",
+                                command=lambda: self.add_recipe_step("RSA Key Gen")).grid(row=current_row, column=0,
+                                                                                          sticky="ew", padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Ed25519 Sign", anchor="w",
+                                command=lambda: self.add_recipe_step("Ed25519 Sign")).grid(row=current_row, column=0,
+                                                                                           sticky="ew", padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="Ed25519 Key Gen", anchor="w",
+                                command=lambda: self.add_recipe_step("Ed25519 Key Gen")).grid(row=current_row,
+                                                                                              column=0, sticky="ew",
+                                                                                              padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="X25519 Seal", anchor="w",
+                                command=lambda: self.add_recipe_step("X25519 Seal")).grid(row=current_row, column=0,
+                                                                                          sticky="ew", padx=10, pady=2)
+        current_row += 1
+        customtkinter.CTkButton(scrollable_frame, text="X25519 Key Gen", anchor="w",
+                                command=lambda: self.add_recipe_step("X25519 Key Gen")).grid(row=current_row,
+                                                                                             column=0, sticky="ew",
+                                                                                             padx=10, pady=2)
+        current_row += 1
         current_row = add_separator(current_row)
 
         # --- Section: Hashing ---
@@ -229,13 +194,10 @@ class EncryptFrame(BaseFrame):
         filepath = filedialog.askopenfilename(title="Load Recipe", filetypes=[("JSON files", "*.json")])
         if not filepath: return
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                recipe_data = json.load(f)
+            recipe = load_recipe_file(filepath)
             self.clear_recipe()
-            for step in recipe_data:
-                operation_name = step.get("operation")
-                args = step.get("args", {})
-                if operation_name: self.add_recipe_step(operation_name, args=args)
+            for step in recipe:
+                self.add_recipe_step(step.operation, args=step.args)
             self.status_bar.configure(text=f"Recipe loaded!", text_color="gray70")
         except Exception as e:
             self.app.show_toast("File Error", f"Failed to load recipe: {e}", toast_type="error")
\ No newline at end of file
@@ -0,0 +1,27 @@
+# File: gui/explain_window.py
+
+import customtkinter
+
+
+class ExplainWindow(customtkinter.CTkToplevel):
+    """Shows the optimizer's plan for the current recipe: original and optimized steps plus every rewrite."""
+
+    def __init__(self, master, optimized, **kwargs):
+        super().__init__(master, **kwargs)
+        self.title("Recipe Plan")
+        self.geometry("640x420")
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        saved = optimized.passes_saved
+        customtkinter.CTkLabel(self, text=f"Optimizer saves {saved} pass{'es' if saved != 1 else ''}",
+                               font=customtkinter.CTkFont(size=18, weight="bold")).grid(row=0, column=0, padx=20,
+                                                                                        pady=(10, 5), sticky="w")
+
+        textbox = customtkinter.CTkTextbox(self, wrap="word")
+        textbox.grid(row=1, column=0, padx=10, pady=(5, 10), sticky="nsew")
+        textbox.insert("1.0", optimized.explain())
+        textbox.configure(state="disabled")
+
+        self.after(100, self.lift)
@@ -0,0 +1,91 @@
+# File: gui/output_view.py
+
+import customtkinter
+
+
+def format_size(num_bytes: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+class OutputView(customtkinter.CTkFrame):
+    """
+    Read-only output box that only renders one page of the result at a time.
+
+    The full result stays in `self.data` (an engine Data value); the textbox
+    only ever holds PAGE_SIZE characters, so multi-megabyte outputs display
+    instantly. Copy and save should read from `self.data`, not the widget.
+    """
+
+    PAGE_SIZE = 64 * 1024
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.data = None
+        self.text = ""
+        self.page = 0
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.textbox = customtkinter.CTkTextbox(self, state="disabled")
+        self.textbox.grid(row=0, column=0, sticky="nsew")
+
+        nav_frame = customtkinter.CTkFrame(self, fg_color="transparent")
+        nav_frame.grid(row=1, column=0, pady=(5, 0), sticky="ew")
+        nav_frame.grid_columnconfigure(1, weight=1)
+        self.prev_button = customtkinter.CTkButton(nav_frame, text="◀", width=28, command=self.previous_page,
+                                                   state="disabled")
+        self.prev_button.grid(row=0, column=0)
+        self.info_label = customtkinter.CTkLabel(nav_frame, text="", font=("", 12), text_color="gray60")
+        self.info_label.grid(row=0, column=1, sticky="ew")
+        self.next_button = customtkinter.CTkButton(nav_frame, text="▶", width=28, command=self.next_page,
+                                                   state="disabled")
+        self.next_button.grid(row=0, column=2)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.text) // self.PAGE_SIZE))
+
+    def set_data(self, data):
+        """Shows a new result, starting at its first page."""
+        self.data = data
+        self.text = data.display_text()
+        self.show_page(0)
+
+    def clear(self):
+        self.data = None
+        self.text = ""
+        self.show_page(0)
+
+    def is_empty(self) -> bool:
+        return not self.text
+
+    def show_page(self, page: int):
+        self.page = min(max(page, 0), self.page_count - 1)
+        start = self.page * self.PAGE_SIZE
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", self.text[start:start + self.PAGE_SIZE])
+        self.textbox.configure(state="disabled")
+
+        self.prev_button.configure(state="normal" if self.page > 0 else "disabled")
+        self.next_button.configure(state="normal" if self.page < self.page_count - 1 else "disabled")
+        if self.data is None:
+            self.info_label.configure(text="")
+        elif self.page_count == 1:
+            self.info_label.configure(text=f"{format_size(len(self.data))} · {len(self.text):,} chars")
+        else:
+            end = min(start + self.PAGE_SIZE, len(self.text))
+            self.info_label.configure(
+                text=f"{format_size(len(self.data))} · chars {start + 1:,}–{end:,} of {len(self.text):,} "
+                     f"· page {self.page + 1}/{self.page_count}")
+
+    def previous_page(self):
+        self.show_page(self.page - 1)
+
+    def next_page(self):
+        self.show_page(self.page + 1)
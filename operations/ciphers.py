@@ -1,11 +1,53 @@
 # File: operations/ciphers.py
 
-def caesar_cipher(text: str, shift: int, decrypt: bool = False) -> tuple[bool, str]:
+from functools import lru_cache
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+# --- Letter translation tables ---
+# Caesar, ROT13 and Atbash only change ASCII letters, so each is a fixed
+# translation table applied in a single pass; everything else is unchanged.
+LOWERCASE_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+UPPERCASE_LETTERS = LOWERCASE_LETTERS.upper()
+VIGENERE_BLOCK_SIZE = 1024 * 1024
+
+
+def _translation_tables(lowercase: str, uppercase: str) -> tuple[dict, bytes]:
+    """A str table and the equivalent bytes table mapping a-z and A-Z to the given letters."""
+    source = LOWERCASE_LETTERS + UPPERCASE_LETTERS
+    target = lowercase + uppercase
+    return str.maketrans(source, target), bytes.maketrans(source.encode('ascii'), target.encode('ascii'))
+
+
+@lru_cache(maxsize=None)
+def _caesar_tables(shift: int) -> tuple[dict, bytes]:
+    return _translation_tables(LOWERCASE_LETTERS[shift:] + LOWERCASE_LETTERS[:shift],
+                               UPPERCASE_LETTERS[shift:] + UPPERCASE_LETTERS[:shift])
+
+
+_ATBASH_TABLES = _translation_tables(LOWERCASE_LETTERS[::-1], UPPERCASE_LETTERS[::-1])
+
+
+def _translate(data: Union[str, bytes], tables: tuple[dict, bytes]) -> Union[str, bytes]:
+    """Applies a letter table to text or raw bytes; bytes in gives bytes out."""
+    str_table, bytes_table = tables
+    if isinstance(data, bytes):
+        # Multi-byte UTF-8 sequences only use bytes >= 0x80, which the table leaves alone.
+        return data.translate(bytes_table)
+    if data.isascii():
+        return data.translate(str_table)
+    # str.translate falls back to a slow per-character path for non-ASCII text.
+    return data.encode('utf-8', 'surrogatepass').translate(bytes_table).decode('utf-8', 'surrogatepass')
+
+
+def caesar_cipher(text: Union[str, bytes], shift: int, decrypt: bool = False) -> tuple[bool, Union[str, bytes]]:
     """
     Encrypts or decrypts text using the Caesar cipher method.
 
     Args:
-        text (str): The input string to be processed.
+        text (str or bytes): The input to be processed. Bytes are treated
+                             as ASCII/UTF-8 and returned as bytes.
         shift (int): The number of positions to shift letters.
         decrypt (bool): If True, the function will decrypt the text.
                          If False, it will encrypt.
@@ -19,40 +61,18 @@ def caesar_cipher(text: str, shift: int, decrypt: bool = False) -> tuple[bool, s
     if decrypt:
         shift = -shift
 
-    result = ""
-    for char in text:
-        if 'a' <= char <= 'z':
-            # Handle lowercase letters
-            shifted_char = chr(((ord(char) - ord('a') + shift) % 26) + ord('a'))
-            result += shifted_char
-        elif 'A' <= char <= 'Z':
-            # Handle uppercase letters
-            shifted_char = chr(((ord(char) - ord('A') + shift) % 26) + ord('A'))
-            result += shifted_char
-        else:
-            # Keep non-alphabetic characters unchanged
-            result += char
+    return True, _translate(text, _caesar_tables(shift % 26))
 
-    return True, result
 
-
-def atbash_cipher(text: str) -> tuple[bool, str]:
+def atbash_cipher(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
     """
     Encrypts or decrypts text using the Atbash cipher method.
     The cipher is reciprocal, so encryption and decryption are the same.
     """
-    result = ""
-    for char in text:
-        if 'a' <= char <= 'z':
-            result += chr(ord('z') - ord(char) + ord('a'))
-        elif 'A' <= char <= 'Z':
-            result += chr(ord('Z') - ord(char) + ord('A'))
-        else:
-            result += char
-    return True, result
-
-
-def rot13_cipher(text: str) -> tuple[bool, str]:
+    return True, _translate(text, _ATBASH_TABLES)
+
+
+def rot13_cipher(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
     """
     Encrypts/decrypts text using the ROT13 cipher.
     ROT13 is a special case of the Caesar cipher with a shift of 13.
@@ -60,12 +80,65 @@ def rot13_cipher(text: str) -> tuple[bool, str]:
     return caesar_cipher(text, 13)
 
 
-def vigenere_cipher(text: str, key: str, decrypt: bool = False) -> tuple[bool, str]:
+SUBSTITUTION_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@lru_cache(maxsize=64)
+def _substitution_tables(alphabet: str) -> tuple[dict, bytes]:
+    return _translation_tables(alphabet[:26], alphabet[26:])
+
+
+def substitution_cipher(text: Union[str, bytes], alphabet: str) -> tuple[bool, Union[str, bytes]]:
+    """
+    Applies a monoalphabetic substitution to the ASCII letters of the text.
+
+    Args:
+        text (str or bytes): The input to be processed. Bytes are treated
+                             as ASCII/UTF-8 and returned as bytes.
+        alphabet (str): 52 letters giving the replacement for each letter of
+                        SUBSTITUTION_LETTERS (a-z then A-Z), in that order.
+
+    Returns:
+        A tuple containing a boolean for success and the resulting string.
+    """
+    if len(alphabet) != len(SUBSTITUTION_LETTERS) or not set(alphabet) <= set(SUBSTITUTION_LETTERS):
+        return False, "Substitution alphabet must be 52 ASCII letters (a-z then A-Z)."
+    return True, _translate(text, _substitution_tables(alphabet))
+
+
+def _vigenere_bytes(data: bytes, shifts: np.ndarray) -> bytes:
+    """Shifts the ASCII letters of `data` by the repeating key stream `shifts`; other bytes are unchanged."""
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    output = buffer.copy()
+    # The key repeated over one block, plus one extra copy so any rotation can be sliced out of it.
+    key_cycle = np.tile(shifts, min(len(buffer), VIGENERE_BLOCK_SIZE) // len(shifts) + 2)
+    key_offset = 0
+    # Work in blocks so the index arrays stay small on very large inputs.
+    for start in range(0, len(buffer), VIGENERE_BLOCK_SIZE):
+        block = buffer[start:start + VIGENERE_BLOCK_SIZE]
+        # Folding to lowercase maps both cases of a letter to its 0-25 alphabet index.
+        positions = np.flatnonzero((block | 0x20) - np.uint8(ord('a')) < 26)
+        if not positions.size:
+            continue
+        letters = block.take(positions)
+        shifted = (letters | 0x20) - np.uint8(ord('a')) + key_cycle[key_offset:key_offset + positions.size]
+        # Subtracting 26 wraps to >= 230 for values already below 26, so the minimum is the value mod 26.
+        shifted = np.minimum(shifted, shifted - np.uint8(26))
+        output[start:start + VIGENERE_BLOCK_SIZE][positions] = (shifted + np.uint8(ord('A'))) | (letters & 0x20)
+        key_offset = (key_offset + positions.size) % len(shifts)
+    return output.tobytes()
+
+
+def vigenere_cipher(text: Union[str, bytes], key: str, decrypt: bool = False) -> tuple[bool, Union[str, bytes]]:
     """
     Encrypts/decrypts text using the Vigenère cipher.
 
+    Only ASCII letters are shifted and only they advance the key; case is
+    preserved and everything else passes through unchanged.
+
     Args:
-        text (str): The input string to be processed.
+        text (str or bytes): The input to be processed. Bytes are treated
+                             as ASCII/UTF-8 and returned as bytes.
         key (str): The keyword to use for shifting.
         decrypt (bool): If True, the function will decrypt the text.
 
@@ -75,32 +148,14 @@ def vigenere_cipher(text: str, key: str, decrypt: bool = False) -> tuple[bool, s
     if not key.isalpha():
         return False, "Key must contain only alphabetic characters."
 
-    key_repeated = (key.upper() * (len(text) // len(key) + 1))[:len(text)]
-    result = ""
-    key_index = 0
-
-    for char in text:
-        shift = 0
-        if 'a' <= char <= 'z':
-            shift = ord(key_repeated[key_index]) - ord('A')
-            if decrypt:
-                shifted_char = chr(((ord(char) - ord('a') - shift + 26) % 26) + ord('a'))
-            else:
-                shifted_char = chr(((ord(char) - ord('a') + shift) % 26) + ord('a'))
-            result += shifted_char
-            key_index += 1
-        elif 'A' <= char <= 'Z':
-            shift = ord(key_repeated[key_index]) - ord('A')
-            if decrypt:
-                shifted_char = chr(((ord(char) - ord('A') - shift + 26) % 26) + ord('A'))
-            else:
-                shifted_char = chr(((ord(char) - ord('A') + shift) % 26) + ord('A'))
-            result += shifted_char
-            key_index += 1
-        else:
-            result += char
-
-    return True, result
+    shifts = np.array([(ord(char) - ord('A')) % 26 for char in key.upper()], dtype=np.uint8)
+    if decrypt:
+        shifts = (26 - shifts) % 26
+
+    if isinstance(text, bytes):
+        return True, _vigenere_bytes(text, shifts)
+    raw = text.encode('utf-8', 'surrogatepass')
+    return True, _vigenere_bytes(raw, shifts).decode('utf-8', 'surrogatepass')
 
 
 # File: operations/ciphers.py
@@ -111,11 +166,99 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
 import os
+import base64
 import hashlib
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 
+def _as_bytes(data: Union[str, bytes]) -> bytes:
+    return data if isinstance(data, bytes) else data.encode('utf-8')
 
-def aes_encrypt(text: str, key: str) -> tuple[bool, str]:
-    """Encrypts text using AES-256."""
+
+def _hex_output(raw: bytes, data: Union[str, bytes]) -> Union[str, bytes]:
+    """Hex-encodes ciphertext, as bytes for bytes input and as a string otherwise."""
+    return raw.hex().encode('ascii') if isinstance(data, bytes) else raw.hex()
+
+
+def _plaintext_output(raw: bytes, data: Union[str, bytes]) -> Union[str, bytes]:
+    """Returns raw plaintext for bytes input, or decodes it as UTF-8 for string input."""
+    return raw if isinstance(data, bytes) else raw.decode('utf-8')
+
+
+# --- Ciphertext formats ---
+# "hex" is the original iv.hex() + ct.hex() text, twice the size of the
+# ciphertext. "raw" and "base64" instead start with a 7-byte header naming
+# the algorithm, mode and IV length, so the decrypt functions can check what
+# they were given rather than assume it.
+OUTPUT_FORMATS = ("hex", "base64", "raw")
+CIPHERTEXT_MAGIC = b"CSC"
+CIPHERTEXT_VERSION = 1
+CIPHERTEXT_HEADER = struct.Struct(">3sBBBB")
+CIPHERTEXT_ALGORITHMS = {"AES": 1, "DES": 2, "Triple DES": 3, "Blowfish": 4}
+CIPHERTEXT_MODES = {"CBC": 1}
+# Base64 of the magic; hex text can never start with it.
+CIPHERTEXT_BASE64_PREFIX = base64.b64encode(CIPHERTEXT_MAGIC)
+
+
+def ciphertext_header(algorithm: str, iv_size: int) -> bytes:
+    """The header that starts raw and Base64 ciphertext."""
+    return CIPHERTEXT_HEADER.pack(CIPHERTEXT_MAGIC, CIPHERTEXT_VERSION, CIPHERTEXT_ALGORITHMS[algorithm],
+                                  CIPHERTEXT_MODES["CBC"], iv_size)
+
+
+def _ciphertext_output(algorithm: str, iv: bytes, ct: bytes, data: Union[str, bytes],
+                       output: str = "hex") -> Union[str, bytes]:
+    """
+    Encodes an IV and ciphertext in one of OUTPUT_FORMATS.
+
+    Hex and Base64 come back as bytes for bytes input and as a string
+    otherwise; raw output is always bytes.
+    """
+    if output == "hex":
+        return _hex_output(iv + ct, data)
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output}'. Use hex, base64 or raw.")
+    header = ciphertext_header(algorithm, len(iv))
+    if output == "raw":
+        return header + iv + ct
+    encoded = base64.b64encode(header + iv + ct)
+    return encoded if isinstance(data, bytes) else encoded.decode('ascii')
+
+
+def parse_ciphertext(data: Union[str, bytes], algorithm: str, iv_size: int) -> tuple[bytes, bytes]:
+    """
+    Splits ciphertext in any of OUTPUT_FORMATS into its IV and ciphertext.
+
+    Raw and Base64 input is recognised by its header, which must name the
+    expected algorithm; anything else is read as iv.hex() + ct.hex().
+    Raises ValueError on malformed input.
+    """
+    raw = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+    if raw.lstrip().startswith(CIPHERTEXT_BASE64_PREFIX):
+        raw = base64.b64decode(raw)
+    if not raw.startswith(CIPHERTEXT_MAGIC):
+        ciphertext = raw.decode('ascii')
+        return bytes.fromhex(ciphertext[:2 * iv_size]), bytes.fromhex(ciphertext[2 * iv_size:])
+    if len(raw) < CIPHERTEXT_HEADER.size:
+        raise ValueError("Ciphertext header is truncated.")
+    _, version, algorithm_id, mode_id, header_iv_size = CIPHERTEXT_HEADER.unpack_from(raw)
+    if version != CIPHERTEXT_VERSION:
+        raise ValueError(f"Unsupported ciphertext format version {version}.")
+    if algorithm_id != CIPHERTEXT_ALGORITHMS[algorithm]:
+        names = {value: name for name, value in CIPHERTEXT_ALGORITHMS.items()}
+        raise ValueError(f"Ciphertext was encrypted with {names.get(algorithm_id, 'an unknown cipher')}, "
+                         f"not {algorithm}.")
+    if mode_id != CIPHERTEXT_MODES["CBC"] or header_iv_size != iv_size:
+        raise ValueError("Ciphertext header does not match this cipher's mode or IV size.")
+    body = raw[CIPHERTEXT_HEADER.size:]
+    return body[:iv_size], body[iv_size:]
+
+
+def aes_encrypt(text: Union[str, bytes], key: str, output: str = "hex") -> tuple[bool, Union[str, bytes]]:
+    """Encrypts text using AES-256, encoded as one of OUTPUT_FORMATS."""
     try:
         if len(key) not in [16, 24, 32]:
             return False, "Invalid AES key size. Must be 16, 24, or 32 bytes."
@@ -124,13 +267,13 @@ def aes_encrypt(text: str, key: str) -> tuple[bool, str]:
         iv = os.urandom(16)
         
         padder = padding.PKCS7(algorithms.AES.block_size).padder()
-        padded_data = padder.update(text.encode('utf-8')) + padder.finalize()
+        padded_data = padder.update(_as_bytes(text)) + padder.finalize()
         
         cipher = Cipher(algorithms.AES(key_bytes), modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
         ct = encryptor.update(padded_data) + encryptor.finalize()
         
-        return True, iv.hex() + ct.hex()
+        return True, _ciphertext_output("AES", iv, ct, text, output)
     except Exception as e:
         return False, f"Failed to encrypt with AES: {e}"
 
@@ -139,8 +282,8 @@ def aes_encrypt(text: str, key: str) -> tuple[bool, str]:
 
 # ... (rest of the file)
 
-def des_encrypt(text: str, key: str) -> tuple[bool, str]:
-    """Encrypts text using DES."""
+def des_encrypt(text: Union[str, bytes], key: str, output: str = "hex") -> tuple[bool, Union[str, bytes]]:
+    """Encrypts text using DES, encoded as one of OUTPUT_FORMATS."""
     try:
         if len(key) != 8:
             return False, "Invalid DES key size. Must be 8 bytes."
@@ -149,19 +292,19 @@ def des_encrypt(text: str, key: str) -> tuple[bool, str]:
         iv = os.urandom(8)
         
         padder = padding.PKCS7(algorithms.TripleDES.block_size).padder()
-        padded_data = padder.update(text.encode('utf-8')) + padder.finalize()
+        padded_data = padder.update(_as_bytes(text)) + padder.finalize()
         
         cipher = Cipher(algorithms.TripleDES(key_bytes), modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
         ct = encryptor.update(padded_data) + encryptor.finalize()
 
-        return True, iv.hex() + ct.hex()
+        return True, _ciphertext_output("DES", iv, ct, text, output)
     except Exception as e:
         return False, f"Failed to encrypt with DES: {e}"
 
 
-def triple_des_encrypt(text: str, key: str) -> tuple[bool, str]:
-    """Encrypts text using Triple DES."""
+def triple_des_encrypt(text: Union[str, bytes], key: str, output: str = "hex") -> tuple[bool, Union[str, bytes]]:
+    """Encrypts text using Triple DES, encoded as one of OUTPUT_FORMATS."""
     try:
         # TDES keys must be 16 or 24 bytes
         if len(key) not in [16, 24]:
@@ -171,19 +314,19 @@ def triple_des_encrypt(text: str, key: str) -> tuple[bool, str]:
         iv = os.urandom(8)
 
         padder = padding.PKCS7(algorithms.TripleDES.block_size).padder()
-        padded_data = padder.update(text.encode('utf-8')) + padder.finalize()
+        padded_data = padder.update(_as_bytes(text)) + padder.finalize()
 
         cipher = Cipher(algorithms.TripleDES(key_bytes), modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
         ct = encryptor.update(padded_data) + encryptor.finalize()
         
-        return True, iv.hex() + ct.hex()
+        return True, _ciphertext_output("Triple DES", iv, ct, text, output)
     except Exception as e:
         return False, f"Failed to encrypt with Triple DES: {e}"
 
 
-def blowfish_encrypt(text: str, key: str) -> tuple[bool, str]:
-    """Encrypts text using Blowfish."""
+def blowfish_encrypt(text: Union[str, bytes], key: str, output: str = "hex") -> tuple[bool, Union[str, bytes]]:
+    """Encrypts text using Blowfish, encoded as one of OUTPUT_FORMATS."""
     try:
         # Blowfish key size must be between 4 and 56 bytes.
         if not 4 <= len(key) <= 56:
@@ -193,13 +336,13 @@ def blowfish_encrypt(text: str, key: str) -> tuple[bool, str]:
         iv = os.urandom(8)
 
         padder = padding.PKCS7(algorithms.Blowfish.block_size).padder()
-        padded_data = padder.update(text.encode('utf-8')) + padder.finalize()
+        padded_data = padder.update(_as_bytes(text)) + padder.finalize()
 
         cipher = Cipher(algorithms.Blowfish(key_bytes), modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
         ct = encryptor.update(padded_data) + encryptor.finalize()
         
-        return True, iv.hex() + ct.hex()
+        return True, _ciphertext_output("Blowfish", iv, ct, text, output)
     except Exception as e:
         return False, f"Failed to encrypt with Blowfish: {e}"
     
@@ -208,13 +351,10 @@ def blowfish_encrypt(text: str, key: str) -> tuple[bool, str]:
 
 # ... (existing functions)
 
-def aes_decrypt(text: str, key: str) -> tuple[bool, str]:
+def aes_decrypt(text: Union[str, bytes], key: str) -> tuple[bool, Union[str, bytes]]:
     """Decrypts text using AES-256."""
     try:
-        iv_hex = text[:32]
-        ct_hex = text[32:]
-        iv = bytes.fromhex(iv_hex)
-        ct = bytes.fromhex(ct_hex)
+        iv, ct = parse_ciphertext(text, "AES", 16)
         key_bytes = key.encode('utf-8')
 
         unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
@@ -224,18 +364,15 @@ def aes_decrypt(text: str, key: str) -> tuple[bool, str]:
         padded_data = decryptor.update(ct) + decryptor.finalize()
         unpadded_data = unpadder.update(padded_data) + unpadder.finalize()
         
-        return True, unpadded_data.decode('utf-8')
+        return True, _plaintext_output(unpadded_data, text)
     except Exception as e:
         return False, f"Failed to decrypt with AES: {e}"
 
 
-def des_decrypt(text: str, key: str) -> tuple[bool, str]:
+def des_decrypt(text: Union[str, bytes], key: str) -> tuple[bool, Union[str, bytes]]:
     """Decrypts text using DES."""
     try:
-        iv_hex = text[:16]
-        ct_hex = text[16:]
-        iv = bytes.fromhex(iv_hex)
-        ct = bytes.fromhex(ct_hex)
+        iv, ct = parse_ciphertext(text, "DES", 8)
         key_bytes = key.encode('utf-8')
 
         unpadder = padding.PKCS7(algorithms.TripleDES.block_size).unpadder()
@@ -245,18 +382,15 @@ def des_decrypt(text: str, key: str) -> tuple[bool, str]:
         padded_data = decryptor.update(ct) + decryptor.finalize()
         unpadded_data = unpadder.update(padded_data) + unpadder.finalize()
         
-        return True, unpadded_data.decode('utf-8')
+        return True, _plaintext_output(unpadded_data, text)
     except Exception as e:
         return False, f"Failed to decrypt with DES: {e}"
 
 
-def triple_des_decrypt(text: str, key: str) -> tuple[bool, str]:
+def triple_des_decrypt(text: Union[str, bytes], key: str) -> tuple[bool, Union[str, bytes]]:
     """Decrypts text using Triple DES."""
     try:
-        iv_hex = text[:16]
-        ct_hex = text[16:]
-        iv = bytes.fromhex(iv_hex)
-        ct = bytes.fromhex(ct_hex)
+        iv, ct = parse_ciphertext(text, "Triple DES", 8)
         key_bytes = key.encode('utf-8')
 
         unpadder = padding.PKCS7(algorithms.TripleDES.block_size).unpadder()
@@ -266,18 +400,15 @@ def triple_des_decrypt(text: str, key: str) -> tuple[bool, str]:
         padded_data = decryptor.update(ct) + decryptor.finalize()
         unpadded_data = unpadder.update(padded_data) + unpadder.finalize()
         
-        return True, unpadded_data.decode('utf-8')
+        return True, _plaintext_output(unpadded_data, text)
     except Exception as e:
         return False, f"Failed to decrypt with Triple DES: {e}"
 
 
-def blowfish_decrypt(text: str, key: str) -> tuple[bool, str]:
+def blowfish_decrypt(text: Union[str, bytes], key: str) -> tuple[bool, Union[str, bytes]]:
     """Decrypts text using Blowfish."""
     try:
-        iv_hex = text[:16]
-        ct_hex = text[16:]
-        iv = bytes.fromhex(iv_hex)
-        ct = bytes.fromhex(ct_hex)
+        iv, ct = parse_ciphertext(text, "Blowfish", 8)
         key_bytes = key.encode('utf-8')
 
         unpadder = padding.PKCS7(algorithms.Blowfish.block_size).unpadder()
@@ -287,7 +418,121 @@ def blowfish_decrypt(text: str, key: str) -> tuple[bool, str]:
         padded_data = decryptor.update(ct) + decryptor.finalize()
         unpadded_data = unpadder.update(padded_data) + unpadder.finalize()
         
-        return True, unpadded_data.decode('utf-8')
+        return True, _plaintext_output(unpadded_data, text)
     except Exception as e:
         return False, f"Failed to decrypt with Blowfish: {e}"
-    
\ No newline at end of file
+
+
+# --- Batch encryption ---
+# Block ciphers: (algorithm name in cryptography's `algorithms`, valid key sizes, key size error message).
+# Names are resolved on use, since reading TripleDES or Blowfish emits a deprecation warning.
+BATCH_CIPHERS = {
+    "AES": ("AES", (16, 24, 32), "Invalid AES key size. Must be 16, 24, or 32 bytes."),
+    "DES": ("TripleDES", (8,), "Invalid DES key size. Must be 8 bytes."),
+    "Triple DES": ("TripleDES", (16, 24), "Invalid Triple DES key size. Must be 16 or 24 bytes."),
+    "Blowfish": ("Blowfish", tuple(range(4, 57)),
+                 "Invalid Blowfish key size. Must be between 4 and 56 bytes."),
+}
+BATCH_CHUNK_SIZE = 4096
+# Messages longer than this many blocks get their own CBC context; their key setup is already amortized.
+BATCH_LONG_MESSAGE_BLOCKS = 64
+
+
+def _encrypt_chunk(cipher: str, algorithm, key_bytes: bytes, messages: list, output_format: str) -> list:
+    """
+    CBC-encrypts a list of messages with one key schedule.
+
+    A single ECB context does the block encryptions and the CBC chaining
+    is done with NumPy. Each round encrypts block r of every message that
+    has one in a single update() call, so a chunk of short messages costs
+    a few calls instead of one cipher setup per message.
+    """
+    block_size = algorithm.block_size // 8
+    encryptor = Cipher(algorithm(key_bytes), modes.ECB(), backend=default_backend()).encryptor()
+    padded = []
+    for message in messages:
+        data = _as_bytes(message)
+        pad = block_size - len(data) % block_size
+        padded.append(data + bytes([pad]) * pad)
+    ivs = os.urandom(block_size * len(messages))
+    results = [None] * len(messages)
+
+    short = [i for i, data in enumerate(padded) if len(data) // block_size <= BATCH_LONG_MESSAGE_BLOCKS]
+    for i in set(range(len(messages))) - set(short):
+        iv = ivs[i * block_size:(i + 1) * block_size]
+        cbc = Cipher(algorithm(key_bytes), modes.CBC(iv), backend=default_backend()).encryptor()
+        results[i] = (iv, cbc.update(padded[i]) + cbc.finalize())
+
+    if short:
+        lengths = np.array([len(padded[i]) // block_size for i in short])
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        blocks = np.frombuffer(b"".join(padded[i] for i in short), dtype=np.uint8).reshape(-1, block_size)
+        output = np.empty_like(blocks)
+        previous = np.frombuffer(ivs, dtype=np.uint8).reshape(-1, block_size)[short].copy()
+        for round_index in range(int(lengths.max())):
+            active = np.flatnonzero(lengths > round_index)
+            rows = starts[active] + round_index
+            chained = blocks[rows] ^ previous[active]
+            encrypted = np.frombuffer(encryptor.update(chained.tobytes()), dtype=np.uint8).reshape(-1, block_size)
+            output[rows] = encrypted
+            previous[active] = encrypted
+        output_bytes = output.tobytes()
+        for position, i in enumerate(short):
+            start, end = int(starts[position]) * block_size, int(starts[position] + lengths[position]) * block_size
+            results[i] = (ivs[i * block_size:(i + 1) * block_size], output_bytes[start:end])
+
+    return [_ciphertext_output(cipher, iv, ct, message, output_format) for (iv, ct), message in zip(results, messages)]
+
+
+def encrypt_batch(messages: Iterable[Union[str, bytes]], key: str, cipher: str = "AES",
+                  workers: int = 1, output: str = "hex") -> tuple[bool, Union[Iterator[Union[str, bytes]], str]]:
+    """
+    Encrypts many messages with one key, doing the key setup once per chunk.
+
+    Each ciphertext has a fresh random IV and is encoded exactly as
+    aes_encrypt/des_encrypt/triple_des_encrypt/blowfish_encrypt would with
+    the same `output`, so the matching *_decrypt function reads it.
+
+    Args:
+        messages (iterable): Strings or bytes; bytes in gives bytes out.
+        key (str): The key, validated once for the whole batch.
+        cipher (str): "AES", "DES", "Triple DES" or "Blowfish".
+        workers (int): Threads to spread chunks of BATCH_CHUNK_SIZE messages
+                       over; the cipher backend releases the GIL.
+        output (str): One of OUTPUT_FORMATS.
+
+    Returns:
+        A tuple containing a boolean for success and either an iterator of
+        ciphertexts in input order, produced lazily, or an error message.
+    """
+    if cipher not in BATCH_CIPHERS:
+        return False, f"Unsupported cipher for batch encryption: {cipher}"
+    algorithm_name, key_sizes, key_error = BATCH_CIPHERS[cipher]
+    if len(key) not in key_sizes:
+        return False, key_error
+    if output not in OUTPUT_FORMATS:
+        return False, f"Unknown output format '{output}'. Use hex, base64 or raw."
+    key_bytes = key.encode('utf-8')
+    algorithm = getattr(algorithms, algorithm_name)
+
+    def chunks():
+        iterator = iter(messages)
+        while chunk := list(islice(iterator, BATCH_CHUNK_SIZE)):
+            yield chunk
+
+    def generate():
+        if workers <= 1:
+            for chunk in chunks():
+                yield from _encrypt_chunk(cipher, algorithm, key_bytes, chunk, output)
+            return
+        # Keep a bounded number of chunks in flight so results stream out in order.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks():
+                pending.append(executor.submit(_encrypt_chunk, cipher, algorithm, key_bytes, chunk, output))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    return True, generate()
@@ -0,0 +1,185 @@
+# File: operations/cryptanalysis.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+import numpy as np
+
+from operations.ciphers import caesar_cipher, vigenere_cipher
+
+# --- Constants ---
+# Relative frequencies of a-z in English text.
+ENGLISH_FREQUENCIES = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+ENGLISH_FREQUENCIES /= ENGLISH_FREQUENCIES.sum()
+ENGLISH_IOC = float(np.sum(ENGLISH_FREQUENCIES ** 2))
+RANDOM_IOC = 1 / 26
+
+# SHIFT_INDEX[s, i] is the ciphertext letter that decrypts to letter i under shift s.
+SHIFT_INDEX = (np.arange(26)[:, None] + np.arange(26)[None, :]) % 26
+
+DEFAULT_MAX_KEY_LENGTH = 20
+DEFAULT_KEY_CANDIDATES = 3
+KASISKI_MAX_LETTERS = 20000
+# Below this many letters, solving in-process is faster than starting a pool.
+PARALLEL_MIN_LETTERS = 50000
+
+
+def letter_indices(text: Union[str, bytes]) -> np.ndarray:
+    """The ASCII letters of the text as 0-25 alphabet indices (case folded, everything else dropped)."""
+    raw = text if isinstance(text, bytes) else text.encode('utf-8', 'surrogatepass')
+    folded = (np.frombuffer(raw, dtype=np.uint8) | 0x20) - np.uint8(ord('a'))
+    return folded[folded < 26]
+
+
+def chi_squared_by_shift(indices: np.ndarray) -> np.ndarray:
+    """Chi-squared distance from English of the letters decrypted with each of the 26 shifts."""
+    counts = np.bincount(indices, minlength=26).astype(float)
+    expected = ENGLISH_FREQUENCIES * max(len(indices), 1)
+    return np.sum((counts[SHIFT_INDEX] - expected) ** 2 / expected, axis=1)
+
+
+def index_of_coincidence(indices: np.ndarray) -> float:
+    n = len(indices)
+    if n < 2:
+        return 0.0
+    counts = np.bincount(indices, minlength=26).astype(float)
+    return float(np.sum(counts * (counts - 1)) / (n * (n - 1)))
+
+
+def column_ioc(indices: np.ndarray, key_length: int) -> float:
+    """Average index of coincidence of the columns the text splits into for a given key length."""
+    return float(np.mean([index_of_coincidence(indices[column::key_length]) for column in range(key_length)]))
+
+
+def kasiski_votes(indices: np.ndarray, max_key_length: int) -> np.ndarray:
+    """
+    Kasiski examination: for every key length, the fraction of distances
+    between repeated trigrams that it divides.
+    """
+    indices = indices[:KASISKI_MAX_LETTERS].astype(np.int32)
+    votes = np.zeros(max_key_length + 1)
+    if len(indices) < 3:
+        return votes
+    trigrams = indices[:-2] * 676 + indices[1:-1] * 26 + indices[2:]
+    order = np.argsort(trigrams, kind='stable')
+    repeated = trigrams[order][1:] == trigrams[order][:-1]
+    distances = (order[1:] - order[:-1])[repeated]
+    if not distances.size:
+        return votes
+    for key_length in range(2, max_key_length + 1):
+        votes[key_length] = np.count_nonzero(distances % key_length == 0) / distances.size
+    return votes
+
+
+def estimate_key_lengths(indices: np.ndarray, max_key_length: int = DEFAULT_MAX_KEY_LENGTH) -> list[tuple[int, float]]:
+    """
+    Ranks likely Vigenère key lengths, best first.
+
+    Each length scores its column index of coincidence (0 for random text,
+    1 for English) plus its Kasiski vote.
+
+    Returns:
+        A list of (key_length, score) tuples.
+    """
+    max_key_length = max(1, min(max_key_length, len(indices) // 2))
+    votes = kasiski_votes(indices, max_key_length)
+    scores = []
+    for key_length in range(1, max_key_length + 1):
+        ioc = (column_ioc(indices, key_length) - RANDOM_IOC) / (ENGLISH_IOC - RANDOM_IOC)
+        scores.append((key_length, ioc + votes[key_length]))
+    # Multiples of the real length score about as well, so the shorter length wins near-ties.
+    return sorted(scores, key=lambda item: (-round(item[1], 1), item[0]))
+
+
+def shortest_period(key: str) -> str:
+    """Collapses a key that is a repetition of a shorter key, e.g. 'LEMONLEMON' -> 'LEMON'."""
+    for period in range(1, len(key)):
+        if len(key) % period == 0 and key == key[:period] * (len(key) // period):
+            return key[:period]
+    return key
+
+
+def solve_key_length(indices: np.ndarray, key_length: int) -> tuple[str, float]:
+    """
+    Finds the best Vigenère key of a given length by chi-squared scoring each column.
+
+    Returns:
+        A tuple of the key and the chi-squared score per letter of the whole decrypted text.
+    """
+    shifts = np.array([int(np.argmin(chi_squared_by_shift(indices[column::key_length])))
+                       for column in range(key_length)])
+    decrypted = (indices - np.resize(shifts, len(indices))) % 26
+    score = float(chi_squared_by_shift(decrypted)[0]) / max(len(indices), 1)
+    return "".join(chr(ord('A') + shift) for shift in shifts), score
+
+
+def _solve_key_lengths(indices: np.ndarray, key_lengths: list[int], workers) -> list[tuple[str, float]]:
+    if workers == 1 or len(indices) < PARALLEL_MIN_LETTERS or len(key_lengths) < 2:
+        return [solve_key_length(indices, key_length) for key_length in key_lengths]
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(key_lengths))) as executor:
+        return list(executor.map(solve_key_length, [indices] * len(key_lengths), key_lengths))
+
+
+def crack_caesar(text: str) -> tuple[bool, Union[list[tuple[int, float, str]], str]]:
+    """
+    Ranks all 25 Caesar shifts by how English the decrypted text looks.
+
+    Args:
+        text (str): The ciphertext.
+
+    Returns:
+        A tuple containing a boolean for success and either a list of
+        (shift, chi-squared score per letter, plaintext) tuples, best
+        first, or an error message.
+    """
+    try:
+        indices = letter_indices(text)
+        if not len(indices):
+            return False, "Ciphertext contains no letters to analyse."
+        scores = chi_squared_by_shift(indices) / len(indices)
+        ranking = sorted(range(1, 26), key=lambda shift: scores[shift])
+        return True, [(shift, float(scores[shift]), caesar_cipher(text, shift, decrypt=True)[1])
+                      for shift in ranking]
+    except Exception as e:
+        return False, f"Caesar analysis failed: {e}"
+
+
+def crack_vigenere(text: str, max_key_length: int = DEFAULT_MAX_KEY_LENGTH,
+                   candidates: int = DEFAULT_KEY_CANDIDATES,
+                   workers: int = None) -> tuple[bool, Union[list[tuple[str, float, str]], str]]:
+    """
+    Recovers likely Vigenère keys without knowing the key.
+
+    The key length is estimated with the index of coincidence and Kasiski
+    examination; the best `candidates` lengths are then solved column by
+    column with chi-squared scoring, across a process pool for large texts.
+
+    Args:
+        text (str): The ciphertext.
+        max_key_length (int): The longest key length to consider.
+        candidates (int): How many key lengths to solve.
+        workers (int): Pool size; None for one per CPU, 1 to stay in-process.
+
+    Returns:
+        A tuple containing a boolean for success and either a list of
+        (key, chi-squared score per letter, plaintext) tuples, best first,
+        or an error message.
+    """
+    try:
+        indices = letter_indices(text)
+        if len(indices) < 2:
+            return False, "Ciphertext contains too few letters to analyse."
+        key_lengths = [key_length for key_length, _ in estimate_key_lengths(indices, max_key_length)[:candidates]]
+        keys = {}
+        for key, score in _solve_key_lengths(indices, key_lengths, workers):
+            key = shortest_period(key)
+            keys[key] = min(score, keys.get(key, score))
+        ranking = sorted(keys.items(), key=lambda item: item[1])
+        return True, [(key, score, vigenere_cipher(text, key, decrypt=True)[1]) for key, score in ranking]
+    except Exception as e:
+        return False, f"Vigenère analysis failed: {e}"
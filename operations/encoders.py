@@ -1,11 +1,14 @@
 # File: operations/encoders.py
 
 import base64
+from typing import Union
 
 
-def to_base64(input_string: str) -> tuple[bool, str]:
-    """Encodes a standard string to Base64."""
+def to_base64(input_string: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Encodes a standard string (or raw bytes) to Base64. Bytes in, bytes out."""
     try:
+        if isinstance(input_string, bytes):
+            return True, base64.b64encode(input_string)
         # The base64 library works on bytes, so we encode the string first.
         input_bytes = input_string.encode('utf-8')
         base64_bytes = base64.b64encode(input_bytes)
@@ -16,9 +19,11 @@ def to_base64(input_string: str) -> tuple[bool, str]:
         return False, f"Failed to encode: {e}"
 
 
-def from_base64(input_string: str) -> tuple[bool, str]:
-    """Decodes a Base64 string back to a standard string."""
+def from_base64(input_string: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Decodes a Base64 string back to a standard string. Bytes in, raw bytes out."""
     try:
+        if isinstance(input_string, bytes):
+            return True, base64.b64decode(input_string)
         # We need to encode the string back to bytes to be decoded.
         base64_bytes = input_string.encode('utf-8')
         decoded_bytes = base64.b64decode(base64_bytes)
@@ -0,0 +1,528 @@
+# File: operations/file_encryption.py
+
+import math
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# --- Constants ---
+# File layout: header, then frames of (4-byte ciphertext length, ciphertext + 16-byte GCM tag).
+# Header: magic, version, chunk size, 8-byte random nonce prefix. Chunk i uses the nonce
+# prefix + i, and authenticates the header, i and a final-chunk flag, so reordered,
+# dropped or truncated chunks fail to decrypt.
+GCM_MAGIC = b"CSGCM"
+GCM_VERSION = 1
+GCM_HEADER = struct.Struct(">5sBI8s")
+GCM_FRAME_LENGTH = struct.Struct(">I")
+GCM_CHUNK_AAD = struct.Struct(">IB")
+GCM_TAG_SIZE = 16
+GCM_MAX_CHUNKS = 2 ** 32
+DEFAULT_GCM_CHUNK_SIZE = 1024 * 1024
+GCM_KEY_SIZES = (16, 24, 32)
+# Bytes a frame adds to its chunk: the length prefix and the tag.
+GCM_FRAME_OVERHEAD = GCM_FRAME_LENGTH.size + GCM_TAG_SIZE
+# Parallel mode hands each pool task a run of at most this many segments.
+PARALLEL_MAX_SEGMENTS_PER_TASK = 16
+
+
+class GcmFormatError(Exception):
+    """Raised when framed AES-GCM data is malformed or fails authentication."""
+
+
+def gcm_key(key: Union[str, bytes]) -> bytes:
+    """Validates an AES key given as text (like aes_encrypt) or raw bytes."""
+    key_bytes = key.encode('utf-8') if isinstance(key, str) else key
+    if len(key_bytes) not in GCM_KEY_SIZES:
+        raise GcmFormatError("Invalid AES key size. Must be 16, 24, or 32 bytes.")
+    return key_bytes
+
+
+class GcmFrameEncryptor:
+    """
+    Produces the framed AES-GCM format incrementally.
+
+    Call header() once, then frame() for each chunk in order, passing
+    final=True for the last one (which may be empty). seal_segment()
+    encrypts any chunk by index, for writing segments out of order.
+    """
+
+    def __init__(self, key: Union[str, bytes], chunk_size: int = DEFAULT_GCM_CHUNK_SIZE, nonce_prefix: bytes = None):
+        self.aead = AESGCM(gcm_key(key))
+        self.chunk_size = chunk_size
+        self.nonce_prefix = nonce_prefix or os.urandom(8)
+        self.header_bytes = GCM_HEADER.pack(GCM_MAGIC, GCM_VERSION, chunk_size, self.nonce_prefix)
+        self.index = 0
+
+    def header(self) -> bytes:
+        return self.header_bytes
+
+    def seal_segment(self, index: int, chunk, final: bool) -> bytes:
+        """Encrypts chunk number `index`, returning its ciphertext and tag without the length prefix."""
+        if index >= GCM_MAX_CHUNKS:
+            raise GcmFormatError("Input is too large for the chunk counter.")
+        nonce = self.nonce_prefix + index.to_bytes(4, 'big')
+        return self.aead.encrypt(nonce, chunk, self.header_bytes + GCM_CHUNK_AAD.pack(index, final))
+
+    def seal(self, chunk, final: bool) -> bytes:
+        """Encrypts the next chunk, returning its ciphertext and tag without the length prefix."""
+        sealed = self.seal_segment(self.index, chunk, final)
+        self.index += 1
+        return sealed
+
+    def frame(self, chunk, final: bool) -> bytes:
+        sealed = self.seal(chunk, final)
+        return GCM_FRAME_LENGTH.pack(len(sealed)) + sealed
+
+
+class GcmFrameDecryptor:
+    """
+    Reads the framed AES-GCM format from a stream of byte chunks.
+
+    Plaintext is only released once its chunk's tag has verified. The most
+    recent frame is held back until more data arrives, because only then
+    is it known not to be the final one.
+    """
+
+    def __init__(self, key: Union[str, bytes]):
+        self.aead = AESGCM(gcm_key(key))
+        self.buffer = b""
+        self.header_bytes = None
+        self.nonce_prefix = None
+        self.held = None
+        self.index = 0
+
+    def open_segment(self, index: int, sealed, final: bool) -> bytes:
+        """Decrypts and verifies chunk number `index`."""
+        nonce = self.nonce_prefix + index.to_bytes(4, 'big')
+        try:
+            return self.aead.decrypt(nonce, sealed, self.header_bytes + GCM_CHUNK_AAD.pack(index, final))
+        except InvalidTag:
+            raise GcmFormatError(f"Authentication failed at chunk {index}: "
+                                 f"the data was modified, truncated or the key is wrong.") from None
+
+    def open_frame(self, sealed, final: bool) -> bytes:
+        plaintext = self.open_segment(self.index, sealed, final)
+        self.index += 1
+        return plaintext
+
+    def read_header(self, header: bytes) -> int:
+        """Checks and stores the header, returning the chunk size it declares."""
+        magic, version, chunk_size, nonce_prefix = GCM_HEADER.unpack(header)
+        if magic != GCM_MAGIC:
+            raise GcmFormatError("Not AES-GCM framed data (bad magic).")
+        if version != GCM_VERSION:
+            raise GcmFormatError(f"Unsupported AES-GCM format version {version}.")
+        self.header_bytes = bytes(header)
+        self.nonce_prefix = nonce_prefix
+        return chunk_size
+
+    def update(self, data) -> bytes:
+        # Frames are sliced out of an immutable buffer as views, so nothing is copied twice.
+        buffer = b"".join((self.buffer, data)) if self.buffer else bytes(data)
+        view, offset, output = memoryview(buffer), 0, []
+        if self.header_bytes is None:
+            if len(view) < GCM_HEADER.size:
+                self.buffer = buffer
+                return b""
+            self.read_header(view[:GCM_HEADER.size])
+            offset = GCM_HEADER.size
+        while len(view) - offset >= GCM_FRAME_LENGTH.size:
+            (length,) = GCM_FRAME_LENGTH.unpack_from(view, offset)
+            if length < GCM_TAG_SIZE:
+                raise GcmFormatError(f"Corrupt frame length at chunk {self.index}.")
+            end = offset + GCM_FRAME_LENGTH.size + length
+            if len(view) < end:
+                break
+            if self.held is not None:
+                output.append(self.open_frame(self.held, final=False))
+            self.held = view[offset + GCM_FRAME_LENGTH.size:end]
+            offset = end
+        self.buffer = view[offset:]
+        return b"".join(output)
+
+    def finalize(self) -> bytes:
+        if self.header_bytes is None or self.held is None or self.buffer:
+            raise GcmFormatError("AES-GCM data is truncated.")
+        plaintext = self.open_frame(self.held, final=True)
+        self.held = None
+        return plaintext
+
+
+def gcm_encrypt(data: Union[str, bytes], key: Union[str, bytes],
+                chunk_size: int = DEFAULT_GCM_CHUNK_SIZE) -> tuple[bool, Union[bytes, str]]:
+    """Encrypts data in memory into the framed AES-GCM format. Always returns raw bytes."""
+    try:
+        raw = data.encode('utf-8') if isinstance(data, str) else data
+        encryptor = GcmFrameEncryptor(key, chunk_size)
+        view = memoryview(raw)
+        frames = [encryptor.header()]
+        offset = 0
+        while True:
+            chunk = view[offset:offset + chunk_size]
+            offset += chunk_size
+            final = offset >= len(raw)
+            frames.append(encryptor.frame(chunk, final))
+            if final:
+                return True, b"".join(frames)
+    except Exception as e:
+        return False, f"Failed to encrypt with AES-GCM: {e}"
+
+
+def gcm_decrypt(data: Union[str, bytes], key: Union[str, bytes]) -> tuple[bool, Union[bytes, str]]:
+    """Decrypts framed AES-GCM data in memory. Returns raw bytes for bytes input, text otherwise."""
+    try:
+        raw = data.encode('latin-1') if isinstance(data, str) else data
+        decryptor = GcmFrameDecryptor(key)
+        plaintext = decryptor.update(raw) + decryptor.finalize()
+        return True, plaintext if isinstance(data, bytes) else plaintext.decode('utf-8')
+    except Exception as e:
+        return False, f"Failed to decrypt with AES-GCM: {e}"
+
+
+@contextmanager
+def _mapped_file(path: str):
+    """A read-only memoryview of a whole memory-mapped file (empty files cannot be mapped)."""
+    with open(path, 'rb') as source:
+        if not os.fstat(source.fileno()).st_size:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            yield view
+
+
+def encrypt_file(input_path: str, output_path: str, key: Union[str, bytes],
+                 chunk_size: int = DEFAULT_GCM_CHUNK_SIZE, token=None, progress=None) -> tuple[bool, str]:
+    """
+    Encrypts a file into the framed AES-GCM format, chunk by chunk.
+
+    The input is memory-mapped, so chunks are handed to the cipher without
+    being copied into Python buffers first.
+
+    Args:
+        input_path (str): The file to encrypt.
+        output_path (str): Where to write the framed ciphertext.
+        key (str or bytes): A 16, 24 or 32 byte AES key.
+        chunk_size (int): Plaintext bytes per authenticated chunk.
+        token (CancellationToken): Checked before every chunk. On cancellation
+                                   the partial output file is removed and
+                                   OperationCancelled is raised.
+        progress (callable): Called as progress(bytes_done, total_bytes).
+
+    Returns:
+        A tuple containing a boolean for success and a status or error message.
+    """
+    try:
+        encryptor = GcmFrameEncryptor(key, chunk_size)
+        with _mapped_file(input_path) as view, open(output_path, 'wb') as sink:
+            try:
+                sink.write(encryptor.header())
+                total, offset, written = len(view), 0, GCM_HEADER.size
+                while True:
+                    if token is not None:
+                        token.raise_if_cancelled()
+                    with view[offset:offset + chunk_size] as chunk:
+                        offset = min(offset + chunk_size, total)
+                        sealed = encryptor.seal(chunk, final=offset >= total)
+                    # Written separately so the chunk isn't copied just to prepend its length.
+                    sink.write(GCM_FRAME_LENGTH.pack(len(sealed)))
+                    sink.write(sealed)
+                    written += GCM_FRAME_LENGTH.size + len(sealed)
+                    if progress is not None:
+                        progress(offset, total)
+                    if offset >= total:
+                        break
+            except BaseException:
+                sink.close()
+                os.remove(output_path)
+                raise
+        return True, f"Encrypted {total} bytes into {written} bytes at {output_path}"
+    except (GcmFormatError, OSError) as e:
+        return False, f"Failed to encrypt file with AES-GCM: {e}"
+
+
+def decrypt_file(input_path: str, output_path: str, key: Union[str, bytes],
+                 token=None, progress=None) -> tuple[bool, str]:
+    """
+    Decrypts a framed AES-GCM file, verifying every chunk before writing it.
+
+    The file is memory-mapped and read frame by frame, so memory use is one
+    chunk. If any chunk fails authentication, the file turns out to be
+    truncated or the run is cancelled, the partial output file is removed.
+
+    Args:
+        input_path (str): The framed ciphertext.
+        output_path (str): Where to write the plaintext.
+        key (str or bytes): The AES key used to encrypt.
+        token (CancellationToken): Checked before every chunk; raises
+                                   OperationCancelled once cancelled.
+        progress (callable): Called as progress(bytes_done, total_bytes).
+
+    Returns:
+        A tuple containing a boolean for success and a status or error message.
+    """
+    try:
+        decryptor = GcmFrameDecryptor(key)
+        with _mapped_file(input_path) as view, open(output_path, 'wb') as sink:
+            try:
+                total = len(view)
+                if total < GCM_HEADER.size:
+                    raise GcmFormatError("AES-GCM data is truncated.")
+                decryptor.read_header(bytes(view[:GCM_HEADER.size]))
+                offset, written = GCM_HEADER.size, 0
+                while offset < total:
+                    if token is not None:
+                        token.raise_if_cancelled()
+                    if total - offset < GCM_FRAME_LENGTH.size:
+                        raise GcmFormatError("AES-GCM data is truncated.")
+                    (length,) = GCM_FRAME_LENGTH.unpack_from(view, offset)
+                    start, end = offset + GCM_FRAME_LENGTH.size, offset + GCM_FRAME_LENGTH.size + length
+                    if length < GCM_TAG_SIZE or end > total:
+                        raise GcmFormatError(f"AES-GCM data is truncated or corrupt at chunk {decryptor.index}.")
+                    with view[start:end] as sealed:
+                        plaintext = decryptor.open_frame(sealed, final=end == total)
+                    sink.write(plaintext)
+                    written += len(plaintext)
+                    offset = end
+                    if progress is not None:
+                        progress(offset, total)
+                if decryptor.index == 0:
+                    raise GcmFormatError("AES-GCM data is truncated.")
+            except BaseException:
+                sink.close()
+                os.remove(output_path)
+                raise
+        return True, f"Decrypted {written} bytes to {output_path}"
+    except (GcmFormatError, OSError) as e:
+        return False, f"Failed to decrypt file with AES-GCM: {e}"
+
+
+# --- Parallel segments ---
+# Every chunk of the framed format has its own nonce and, except for the
+# last, the same size, so segment i always sits at a known offset. That lets
+# a process pool encrypt or decrypt segments independently: each worker
+# maps the input and the pre-sized output file (shared with the other
+# workers through the page cache) and writes its segments in place, so the
+# output is assembled in order without passing data back to the parent.
+
+def segment_count(plaintext_size: int, chunk_size: int) -> int:
+    """How many framed segments a plaintext of the given size is split into (an empty one still has one)."""
+    return max(1, math.ceil(plaintext_size / chunk_size))
+
+
+def _framed_segment_count(file_size: int, chunk_size: int) -> int:
+    """The number of segments in a framed file of the given size, which must match the fixed-size layout."""
+    body = file_size - GCM_HEADER.size
+    frame_size = chunk_size + GCM_FRAME_OVERHEAD
+    if not chunk_size or body < GCM_FRAME_OVERHEAD:
+        raise GcmFormatError("AES-GCM data is truncated.")
+    whole, remainder = divmod(body, frame_size)
+    if not remainder:
+        return whole
+    if remainder < GCM_FRAME_OVERHEAD:
+        raise GcmFormatError("AES-GCM data is truncated or corrupt.")
+    return whole + 1
+
+
+def _read_framed_header(source, key) -> tuple[GcmFrameDecryptor, int, int, int]:
+    """Reads the header of an open framed file: (decryptor, chunk size, segment count, file size)."""
+    file_size = os.fstat(source.fileno()).st_size
+    header = source.read(GCM_HEADER.size)
+    if len(header) < GCM_HEADER.size:
+        raise GcmFormatError("AES-GCM data is truncated.")
+    decryptor = GcmFrameDecryptor(key)
+    chunk_size = decryptor.read_header(header)
+    return decryptor, chunk_size, _framed_segment_count(file_size, chunk_size), file_size
+
+
+def decrypt_segment(input_path: str, key: Union[str, bytes], index: int) -> tuple[bool, Union[bytes, str]]:
+    """
+    Decrypts a single segment of a framed AES-GCM file, reading only its header and that segment.
+
+    Args:
+        input_path (str): The framed ciphertext.
+        key (str or bytes): The AES key used to encrypt.
+        index (int): The segment to decrypt, from 0. Segment i holds
+                     plaintext bytes i * chunk_size onwards.
+
+    Returns:
+        A tuple containing a boolean for success and either the segment's
+        plaintext bytes or an error message.
+    """
+    try:
+        with open(input_path, 'rb') as source:
+            decryptor, chunk_size, count, file_size = _read_framed_header(source, key)
+            if not 0 <= index < count:
+                return False, f"Segment {index} is out of range; the file has {count} segments."
+            offset = GCM_HEADER.size + index * (chunk_size + GCM_FRAME_OVERHEAD)
+            source.seek(offset)
+            frame = source.read(chunk_size + GCM_FRAME_OVERHEAD)
+            final = index == count - 1
+            (length,) = GCM_FRAME_LENGTH.unpack_from(frame)
+            if length != len(frame) - GCM_FRAME_LENGTH.size or (not final and length != chunk_size + GCM_TAG_SIZE):
+                raise GcmFormatError(f"Corrupt frame length at chunk {index}.")
+            return True, decryptor.open_segment(index, frame[GCM_FRAME_LENGTH.size:], final)
+    except (GcmFormatError, OSError, struct.error) as e:
+        return False, f"Failed to decrypt segment with AES-GCM: {e}"
+
+
+_segment_worker = {}
+
+
+def _init_segment_worker(key, header: bytes, input_path: str, output_path: str):
+    """Pool initializer: builds the cipher once and maps both files for the worker's lifetime."""
+    _, _, chunk_size, nonce_prefix = GCM_HEADER.unpack(header)
+    encryptor = GcmFrameEncryptor(key, chunk_size, nonce_prefix)
+    decryptor = GcmFrameDecryptor(key)
+    decryptor.read_header(header)
+    source = open(input_path, 'rb')
+    sink = open(output_path, 'r+b')
+    _segment_worker.update(
+        encryptor=encryptor, decryptor=decryptor, chunk_size=chunk_size,
+        input=mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ),
+        output=mmap.mmap(sink.fileno(), 0, access=mmap.ACCESS_WRITE),
+    )
+
+
+def _encrypt_segments(first: int, last: int, count: int) -> int:
+    """Encrypts segments first..last-1 into the output map; returns the plaintext bytes done."""
+    encryptor, chunk_size = _segment_worker["encryptor"], _segment_worker["chunk_size"]
+    source, sink = _segment_worker["input"], _segment_worker["output"]
+    done = 0
+    for index in range(first, last):
+        chunk = source[index * chunk_size:(index + 1) * chunk_size]
+        sealed = encryptor.seal_segment(index, chunk, final=index == count - 1)
+        offset = GCM_HEADER.size + index * (chunk_size + GCM_FRAME_OVERHEAD)
+        sink[offset:offset + GCM_FRAME_LENGTH.size] = GCM_FRAME_LENGTH.pack(len(sealed))
+        sink[offset + GCM_FRAME_LENGTH.size:offset + GCM_FRAME_LENGTH.size + len(sealed)] = sealed
+        done += len(chunk)
+    return done
+
+
+def _decrypt_segments(first: int, last: int, count: int) -> int:
+    """Verifies and decrypts segments first..last-1 into the output map; returns the plaintext bytes done."""
+    decryptor, chunk_size = _segment_worker["decryptor"], _segment_worker["chunk_size"]
+    source, sink = _segment_worker["input"], _segment_worker["output"]
+    done = 0
+    for index in range(first, last):
+        offset = GCM_HEADER.size + index * (chunk_size + GCM_FRAME_OVERHEAD)
+        (length,) = GCM_FRAME_LENGTH.unpack_from(source, offset)
+        final = index == count - 1
+        expected = len(source) - offset - GCM_FRAME_LENGTH.size if final else chunk_size + GCM_TAG_SIZE
+        if length != expected:
+            raise GcmFormatError(f"Corrupt frame length at chunk {index}.")
+        start = offset + GCM_FRAME_LENGTH.size
+        plaintext = decryptor.open_segment(index, source[start:start + length], final)
+        sink[index * chunk_size:index * chunk_size + len(plaintext)] = plaintext
+        done += len(plaintext)
+    return done
+
+
+def _run_segments(task, count: int, total: int, initargs, workers, token, progress):
+    """Spreads segments over a process pool in runs, reporting progress as runs finish."""
+    workers = workers or os.cpu_count() or 1
+    per_task = max(1, min(PARALLEL_MAX_SEGMENTS_PER_TASK, count // (workers * 4)))
+    done = 0
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_segment_worker, initargs=initargs)
+    try:
+        futures = [executor.submit(task, first, min(first + per_task, count), count)
+                   for first in range(0, count, per_task)]
+        for future in as_completed(futures):
+            if token is not None:
+                token.raise_if_cancelled()
+            done += future.result()
+            if progress is not None:
+                progress(done, total)
+    finally:
+        # Workers must be gone before the caller can remove a failed output file.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_encrypt_file(input_path: str, output_path: str, key: Union[str, bytes],
+                          chunk_size: int = DEFAULT_GCM_CHUNK_SIZE, workers: int = None,
+                          token=None, progress=None) -> tuple[bool, str]:
+    """
+    Encrypts a file into the framed AES-GCM format across a process pool.
+
+    The output is byte-for-byte the format encrypt_file() writes, so it can
+    be read by decrypt_file(), the AES-GCM Decrypt operation or
+    decrypt_segment(). Files of a single segment are encrypted in-process.
+
+    Args:
+        input_path (str): The file to encrypt.
+        output_path (str): Where to write the framed ciphertext.
+        key (str or bytes): A 16, 24 or 32 byte AES key.
+        chunk_size (int): Plaintext bytes per segment.
+        workers (int): Pool size; None for one per CPU.
+        token (CancellationToken): Checked as segments complete. On
+                                   cancellation the partial output file is
+                                   removed and OperationCancelled is raised.
+        progress (callable): Called as progress(bytes_done, total_bytes).
+
+    Returns:
+        A tuple containing a boolean for success and a status or error message.
+    """
+    try:
+        total = os.path.getsize(input_path)
+        count = segment_count(total, chunk_size)
+        if count == 1 or workers == 1:
+            return encrypt_file(input_path, output_path, key, chunk_size, token, progress)
+        encryptor = GcmFrameEncryptor(key, chunk_size)
+        written = GCM_HEADER.size + total + count * GCM_FRAME_OVERHEAD
+        with open(output_path, 'wb') as sink:
+            sink.write(encryptor.header())
+            sink.truncate(written)
+        try:
+            _run_segments(_encrypt_segments, count, total, (key, encryptor.header(), input_path, output_path),
+                          workers, token, progress)
+        except BaseException:
+            os.remove(output_path)
+            raise
+        return True, f"Encrypted {total} bytes into {written} bytes at {output_path}"
+    except (GcmFormatError, OSError, BrokenProcessPool) as e:
+        return False, f"Failed to encrypt file with AES-GCM: {e}"
+
+
+def parallel_decrypt_file(input_path: str, output_path: str, key: Union[str, bytes],
+                          workers: int = None, token=None, progress=None) -> tuple[bool, str]:
+    """
+    Decrypts a framed AES-GCM file across a process pool.
+
+    Every segment is verified by whichever worker decrypts it; if any fails,
+    or the run is cancelled, the partial output file is removed.
+
+    Args:
+        input_path (str): The framed ciphertext.
+        output_path (str): Where to write the plaintext.
+        key (str or bytes): The AES key used to encrypt.
+        workers (int): Pool size; None for one per CPU.
+        token (CancellationToken): Checked as segments complete; raises
+                                   OperationCancelled once cancelled.
+        progress (callable): Called as progress(bytes_done, total_bytes).
+
+    Returns:
+        A tuple containing a boolean for success and a status or error message.
+    """
+    try:
+        with open(input_path, 'rb') as source:
+            decryptor, chunk_size, count, file_size = _read_framed_header(source, key)
+        if count == 1 or workers == 1:
+            return decrypt_file(input_path, output_path, key, token, progress)
+        total = file_size - GCM_HEADER.size - count * GCM_FRAME_OVERHEAD
+        with open(output_path, 'wb') as sink:
+            sink.truncate(total)
+        try:
+            _run_segments(_decrypt_segments, count, total, (key, decryptor.header_bytes, input_path, output_path),
+                          workers, token, progress)
+        except BaseException:
+            os.remove(output_path)
+            raise
+        return True, f"Decrypted {total} bytes to {output_path}"
+    except (GcmFormatError, OSError, BrokenProcessPool) as e:
+        return False, f"Failed to decrypt file with AES-GCM: {e}"
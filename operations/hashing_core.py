@@ -1,35 +1,47 @@
 # File: operations/hashing_core.py
 
 import hashlib
+from typing import Union
 
-def hash_md5(text: str) -> tuple[bool, str]:
-    """Computes the MD5 hash of a string."""
+
+def _as_bytes(data: Union[str, bytes]) -> bytes:
+    return data if isinstance(data, bytes) else data.encode('utf-8')
+
+
+def _hexdigest(hash_object, data: Union[str, bytes]) -> Union[str, bytes]:
+    """Returns the hex digest as bytes for bytes input and as a string otherwise."""
+    digest = hash_object.hexdigest()
+    return digest.encode('ascii') if isinstance(data, bytes) else digest
+
+
+def hash_md5(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Computes the MD5 hash of a string (or raw bytes). Bytes in, bytes out."""
     try:
-        hash_object = hashlib.md5(text.encode('utf-8'))
-        return True, hash_object.hexdigest()
+        hash_object = hashlib.md5(_as_bytes(text))
+        return True, _hexdigest(hash_object, text)
     except Exception as e:
         return False, f"MD5 hashing failed: {e}"
 
-def hash_sha1(text: str) -> tuple[bool, str]:
-    """Computes the SHA-1 hash of a string."""
+def hash_sha1(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Computes the SHA-1 hash of a string (or raw bytes). Bytes in, bytes out."""
     try:
-        hash_object = hashlib.sha1(text.encode('utf-8'))
-        return True, hash_object.hexdigest()
+        hash_object = hashlib.sha1(_as_bytes(text))
+        return True, _hexdigest(hash_object, text)
     except Exception as e:
         return False, f"SHA-1 hashing failed: {e}"
 
-def hash_sha256(text: str) -> tuple[bool, str]:
-    """Computes the SHA-256 hash of a string."""
+def hash_sha256(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Computes the SHA-256 hash of a string (or raw bytes). Bytes in, bytes out."""
     try:
-        hash_object = hashlib.sha256(text.encode('utf-8'))
-        return True, hash_object.hexdigest()
+        hash_object = hashlib.sha256(_as_bytes(text))
+        return True, _hexdigest(hash_object, text)
     except Exception as e:
         return False, f"SHA-256 hashing failed: {e}"
 
-def hash_sha512(text: str) -> tuple[bool, str]:
-    """Computes the SHA-512 hash of a string."""
+def hash_sha512(text: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Computes the SHA-512 hash of a string (or raw bytes). Bytes in, bytes out."""
     try:
-        hash_object = hashlib.sha512(text.encode('utf-8'))
-        return True, hash_object.hexdigest()
+        hash_object = hashlib.sha512(_as_bytes(text))
+        return True, _hexdigest(hash_object, text)
     except Exception as e:
         return False, f"SHA-512 hashing failed: {e}"
\ No newline at end of file
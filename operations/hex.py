@@ -1,8 +1,13 @@
 # File: operations/hex.py
 
-def to_hex(input_string: str) -> tuple[bool, str]:
-    """Encodes a standard string to a Hexadecimal string."""
+from typing import Union
+
+
+def to_hex(input_string: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Encodes a standard string (or raw bytes) to a Hexadecimal string. Bytes in, bytes out."""
     try:
+        if isinstance(input_string, bytes):
+            return True, input_string.hex().encode('ascii')
         # Convert the string to bytes, then to a hex representation.
         input_bytes = input_string.encode('utf-8')
         hex_string = input_bytes.hex()
@@ -11,9 +16,12 @@ def to_hex(input_string: str) -> tuple[bool, str]:
         return False, f"Failed to encode to Hex: {e}"
 
 
-def from_hex(input_string: str) -> tuple[bool, str]:
-    """Decodes a Hexadecimal string back to a standard string."""
+def from_hex(input_string: Union[str, bytes]) -> tuple[bool, Union[str, bytes]]:
+    """Decodes a Hexadecimal string back to a standard string. Bytes in, raw bytes out."""
     try:
+        as_bytes = isinstance(input_string, bytes)
+        if as_bytes:
+            input_string = input_string.decode('ascii')
         # Remove common prefixes and spaces
         cleaned_string = input_string.replace("0x", "").replace(" ", "").strip()
         if len(cleaned_string) % 2 != 0:
@@ -21,6 +29,8 @@ def from_hex(input_string: str) -> tuple[bool, str]:
 
         # Convert the hex string back to bytes, then to a readable string.
         decoded_bytes = bytes.fromhex(cleaned_string)
+        if as_bytes:
+            return True, decoded_bytes
         decoded_string = decoded_bytes.decode('utf-8')
         return True, decoded_string
     except ValueError:
@@ -0,0 +1,185 @@
+# File: operations/key_pool.py
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Union
+
+from operations.asymmetric_ciphers import RSA_KEY_SIZES, format_key_pair, generate_pem_pair
+
+# --- Constants ---
+DEFAULT_POOL_DEPTH = 4
+DEFAULT_POOL_WORKERS = 2
+
+
+class RsaKeyPool:
+    """
+    Keeps pre-generated RSA key pairs ready so rsa_key_gen() returns at once.
+
+    Worker processes generate pairs for each configured key size until
+    `depth` pairs are ready or in flight; every pair handed out by take()
+    is replaced in the background. A burst larger than the pool waits only
+    for the pairs already being generated rather than generating each one
+    in turn. Safe to use from worker threads.
+    """
+
+    def __init__(self, key_sizes=(2048,), depth: Union[int, dict] = DEFAULT_POOL_DEPTH,
+                 workers: int = DEFAULT_POOL_WORKERS):
+        """
+        Args:
+            key_sizes (iterable): Key sizes to keep ready, from RSA_KEY_SIZES.
+            depth (int or dict): Pairs to keep ready, for every size or per size;
+                                 sizes missing from a dict get DEFAULT_POOL_DEPTH.
+            workers (int): Worker processes generating keys.
+        """
+        key_sizes = tuple(key_sizes)
+        for key_size in key_sizes:
+            if key_size not in RSA_KEY_SIZES:
+                raise ValueError(f"Invalid RSA key size {key_size}. Must be 2048, 3072 or 4096 bits.")
+        if isinstance(depth, dict):
+            unknown = set(depth) - set(key_sizes)
+            if unknown:
+                raise ValueError(f"Depth given for key sizes the pool does not serve: {sorted(unknown)}.")
+            self.depth = {key_size: depth.get(key_size, DEFAULT_POOL_DEPTH) for key_size in key_sizes}
+        else:
+            self.depth = dict.fromkeys(key_sizes, depth)
+        self.workers = workers
+        self._ready = {key_size: deque() for key_size in key_sizes}
+        self._in_flight = dict.fromkeys(key_sizes, 0)
+        self._metrics = {key_size: {"generated": 0, "served": 0, "waited": 0, "failures": 0,
+                                    "generation_seconds": 0.0, "max_generation_seconds": 0.0,
+                                    "wait_seconds": 0.0}
+                         for key_size in key_sizes}
+        self._condition = threading.Condition()
+        self._executor = None
+        self._closed = False
+
+    def serves(self, key_size: int) -> bool:
+        return key_size in self._ready and not self._closed
+
+    def start(self) -> "RsaKeyPool":
+        """Starts the worker processes and begins filling the pool."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The key pool has been shut down.")
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                try:
+                    for key_size in self._ready:
+                        self._refill(key_size)
+                except Exception:
+                    # Don't leave worker processes behind if the first submissions fail.
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = None
+                    raise
+        return self
+
+    def _refill(self, key_size: int):
+        """Submits generations until ready + in flight reaches the target depth. Caller holds the lock."""
+        while not self._closed and len(self._ready[key_size]) + self._in_flight[key_size] < self.depth[key_size]:
+            future = self._executor.submit(generate_pem_pair, key_size)
+            self._in_flight[key_size] += 1
+            future.add_done_callback(partial(self._generated, key_size))
+
+    def _generated(self, key_size: int, future):
+        with self._condition:
+            self._in_flight[key_size] -= 1
+            metrics = self._metrics[key_size]
+            if future.cancelled() or future.exception() is not None:
+                metrics["failures"] += 1
+            else:
+                private_pem, public_pem, seconds = future.result()
+                self._ready[key_size].append((private_pem, public_pem))
+                metrics["generated"] += 1
+                metrics["generation_seconds"] += seconds
+                metrics["max_generation_seconds"] = max(metrics["max_generation_seconds"], seconds)
+            self._condition.notify_all()
+
+    def take(self, key_size: int = 2048, timeout: Optional[float] = None) -> str:
+        """
+        Hands out a ready key pair, formatted as rsa_key_gen() returns it.
+
+        If none is ready, waits for the next one being generated (up to
+        `timeout` seconds, raising TimeoutError after that).
+        """
+        if key_size not in self._ready:
+            raise ValueError(f"This pool does not serve {key_size}-bit keys.")
+        if self._executor is None:
+            self.start()
+        start = time.monotonic()
+        with self._condition:
+            metrics = self._metrics[key_size]
+            if not self._ready[key_size]:
+                metrics["waited"] += 1
+            while not self._ready[key_size]:
+                if self._closed:
+                    raise RuntimeError("The key pool has been shut down.")
+                # Also restarts generation after a failed worker.
+                self._refill(key_size)
+                remaining = None if timeout is None else timeout - (time.monotonic() - start)
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No {key_size}-bit key pair became ready within {timeout} seconds.")
+                self._condition.wait(remaining)
+            private_pem, public_pem = self._ready[key_size].popleft()
+            metrics["served"] += 1
+            metrics["wait_seconds"] += time.monotonic() - start
+            self._refill(key_size)
+        return format_key_pair(private_pem, public_pem)
+
+    def stats(self) -> dict:
+        """Pool depth and generation metrics for every key size."""
+        with self._condition:
+            stats = {}
+            for key_size, metrics in self._metrics.items():
+                generated, served = metrics["generated"], metrics["served"]
+                stats[key_size] = {
+                    "ready": len(self._ready[key_size]),
+                    "target_depth": self.depth[key_size],
+                    "in_flight": self._in_flight[key_size],
+                    "generated": generated,
+                    "served": served,
+                    "waited": metrics["waited"],
+                    "failures": metrics["failures"],
+                    "mean_generation_seconds": metrics["generation_seconds"] / generated if generated else None,
+                    "max_generation_seconds": metrics["max_generation_seconds"] if generated else None,
+                    "mean_wait_seconds": metrics["wait_seconds"] / served if served else None,
+                }
+            return stats
+
+    def shutdown(self):
+        """Stops refilling, cancels queued generations and drops the ready keys."""
+        with self._condition:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            for ready in self._ready.values():
+                ready.clear()
+            self._condition.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Default pool ---
+# The application starts one pool that the "RSA Key Gen" operation draws from.
+_default_pool = None
+
+
+def start_default_pool(**kwargs) -> RsaKeyPool:
+    """Starts the shared pool (once); keyword arguments are passed to RsaKeyPool."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = RsaKeyPool(**kwargs).start()
+    return _default_pool
+
+
+def default_pool() -> Optional[RsaKeyPool]:
+    """The shared pool, or None if it has not been started."""
+    return _default_pool
+
+
+def shutdown_default_pool():
+    global _default_pool
+    if _default_pool is not None:
+        _default_pool.shutdown()
+        _default_pool = None
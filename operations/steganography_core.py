@@ -2,8 +2,12 @@
 
 import os
 import base64
+import hashlib
+import hmac
+import threading
+import time
 import numpy as np
-from collections import deque
+from collections import deque, OrderedDict
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
@@ -12,25 +16,138 @@ from cryptography.fernet import Fernet, InvalidToken
 # --- Constants ---
 ENCRYPTION_ITERATIONS = 100000
 MESSAGE_DELIMITER = "####"
-
-
-def generate_key(password, salt=None):
-    """Generates a key from a password using PBKDF2."""
+KEY_CACHE_MAX_ENTRIES = 32
+KEY_CACHE_TTL = 300.0
+
+
+class DerivedKeyCache:
+    """
+    Bounded cache of PBKDF2-derived keys, so a batch of images sharing a
+    password and salt runs the KDF once.
+
+    Entries are keyed by (keyed digest of the password, salt, iterations),
+    so plaintext passwords are never stored, and expire `ttl` seconds after
+    they were derived. Once `max_entries` is exceeded the least recently
+    used entry is evicted. Keys are held in bytearrays that are overwritten
+    with zeros when they expire, are evicted or the cache is cleared.
+    Safe to use from worker threads.
+    """
+
+    def __init__(self, max_entries: int = KEY_CACHE_MAX_ENTRIES, ttl: float = KEY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._secret = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, password: str, salt: bytes, iterations: int) -> tuple:
+        digest = hmac.new(self._secret, password.encode(), hashlib.sha256).digest()
+        return digest, bytes(salt), iterations
+
+    @staticmethod
+    def _zeroize(derived: bytearray):
+        derived[:] = bytes(len(derived))
+
+    def _expire(self, now: float):
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            self._zeroize(self._entries.pop(key)[1])
+            self.evictions += 1
+
+    def get(self, password: str, salt: bytes, iterations: int):
+        """Returns a copy of the cached key, or None on a miss."""
+        key = self.key(password, salt, iterations)
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return bytes(entry[1])
+
+    def put(self, password: str, salt: bytes, iterations: int, derived: bytes):
+        key = self.key(password, salt, iterations)
+        with self._lock:
+            if key in self._entries:
+                self._zeroize(self._entries.pop(key)[1])
+            self._entries[key] = (time.monotonic() + self.ttl, bytearray(derived))
+            while len(self._entries) > self.max_entries:
+                self._zeroize(self._entries.popitem(last=False)[1][1])
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for _, derived in self._entries.values():
+                self._zeroize(derived)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+KEY_CACHE = DerivedKeyCache()
+_session_salt = None
+_session_salt_lock = threading.Lock()
+
+
+def session_salt():
+    """
+    A random salt generated once per process, for reusing one derived key
+    across a batch: pass it to encrypt_message() and the KDF runs only for
+    the first message. Fernet still uses a fresh IV for every message.
+    """
+    global _session_salt
+    with _session_salt_lock:
+        if _session_salt is None:
+            _session_salt = os.urandom(16)
+        return _session_salt
+
+
+def generate_key(password, salt=None, cache=KEY_CACHE):
+    """
+    Generates a key from a password using PBKDF2.
+
+    Keys for a given salt are looked up in and stored to `cache` (None to
+    bypass it); keys for a fresh random salt are never cached, since the
+    salt will not be seen again until the message is decrypted.
+    """
     if salt is None:
-        salt = os.urandom(16)
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=ENCRYPTION_ITERATIONS,
-        backend=default_backend()
-    )
-    return base64.urlsafe_b64encode(kdf.derive(password.encode())), salt
-
-
-def encrypt_message(message, password):
-    """Derives a key and encrypts the message using Fernet (AES-128-CBC)."""
-    key, salt = generate_key(password)
+        salt, cache = os.urandom(16), None
+    derived = cache.get(password, salt, ENCRYPTION_ITERATIONS) if cache is not None else None
+    if derived is None:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=ENCRYPTION_ITERATIONS,
+            backend=default_backend()
+        )
+        derived = kdf.derive(password.encode())
+        if cache is not None:
+            cache.put(password, salt, ENCRYPTION_ITERATIONS, derived)
+    return base64.urlsafe_b64encode(derived), salt
+
+
+def encrypt_message(message, password, salt=None):
+    """
+    Derives a key and encrypts the message using Fernet (AES-128-CBC).
+
+    By default every message gets a fresh random salt. Pass a salt (such as
+    session_salt()) to reuse it, and the cached key, across a batch.
+    """
+    key, salt = generate_key(password, salt)
     cipher = Fernet(key)
     # Prepend the salt to the encrypted message for later use in decryption
     return base64.b64encode(salt + cipher.encrypt(message.encode())).decode()